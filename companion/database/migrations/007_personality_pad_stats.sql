@@ -0,0 +1,22 @@
+-- Migration 007: Precomputed per-user PAD variance for stability scoring
+
+-- Sample variance of each PAD dimension over the last 14 days, one row per user.
+-- Refreshed concurrently by the scheduler every few minutes; readers fall back to
+-- the live aggregate when the view is stale or has no row for the user.
+CREATE MATERIALIZED VIEW IF NOT EXISTS personality_pad_stats AS
+SELECT
+    user_id,
+    var_samp(pleasure) AS pleasure,
+    var_samp(arousal) AS arousal,
+    var_samp(dominance) AS dominance,
+    COUNT(*) AS sample_count,
+    MAX(timestamp) AS last_state_at,
+    NOW() AS refreshed_at
+FROM personality_state
+WHERE timestamp >= NOW() - INTERVAL '14 days'
+GROUP BY user_id;
+
+-- REFRESH ... CONCURRENTLY requires a unique index; it also serves the per-user lookup
+CREATE UNIQUE INDEX IF NOT EXISTS idx_personality_pad_stats_user ON personality_pad_stats(user_id);
+
+COMMENT ON MATERIALIZED VIEW personality_pad_stats IS 'Per-user PAD variance over the last 14 days; refreshed by the scheduler.';
@@ -0,0 +1,11 @@
+-- Migration 008: Indexes matching the ORDER BY of the hot personality reads
+
+-- Active quirks (WHERE is_active, ORDER BY strength DESC) are already served in
+-- order by idx_quirks_strength from migration 002.
+
+-- All quirks for a user, active first then strongest first (get_all_quirks)
+CREATE INDEX IF NOT EXISTS idx_quirks_user_all_ordered ON quirks(user_id, is_active DESC, strength DESC);
+
+-- All needs for a user, most pressing first (get_user_needs); the existing
+-- needs(user_id, current_level DESC) indexes are partial and skip satisfied needs
+CREATE INDEX IF NOT EXISTS idx_needs_user_level ON needs(user_id, current_level DESC);
@@ -216,7 +216,7 @@ async def embed_text(request: EmbedRequest, _: str = Depends(verify_api_key)):
             )
             return result['embedding']
         
-        embedding = await asyncio.get_event_loop().run_in_executor(
+        embedding = await asyncio.get_running_loop().run_in_executor(
             thread_pool, generate_embedding
         )
         
@@ -242,6 +242,8 @@ async def embed_batch(request: EmbedBatchRequest, _: str = Depends(verify_api_ke
     try:
         embeddings = []
         cached_flags = []
+        # Look the loop up once rather than per chunk
+        loop = asyncio.get_running_loop()
         
         # Process in chunks of 100 to respect rate limits
         for chunk in chunk_list(request.texts, 100):
@@ -281,7 +283,7 @@ async def embed_batch(request: EmbedBatchRequest, _: str = Depends(verify_api_ke
                         embeddings.append(result["embedding"])
                     return embeddings
 
-                generated_embeddings = await asyncio.get_event_loop().run_in_executor(
+                generated_embeddings = await loop.run_in_executor(
                     thread_pool, generate_batch_embeddings
                 )
                 
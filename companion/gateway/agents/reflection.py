@@ -2,7 +2,7 @@
 Nightly reflection agent for the AI Companion System.
 Handles memory consolidation, personality evolution, and behavioral pattern analysis.
 """
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 import asyncio
 import logging
@@ -194,8 +194,21 @@ class ReflectionAgent:
                 batch_start = datetime.utcnow()
                 batch_results = []
 
+                # Drift every baseline in the batch with one set-based update; users
+                # fall back to per-user drift if it fails
+                try:
+                    baseline_drift = await self.personality.apply_pad_baseline_drift_batch(
+                        user_batch, drift_rate=0.01
+                    )
+                except Exception as e:
+                    logging.warning(f"Batch baseline drift failed, using per-user drift: {e}")
+                    baseline_drift = None
+
                 # Process users in parallel within batch
-                tasks = [self.process_user_reflection(user_id) for user_id in user_batch]
+                tasks = [
+                    self.process_user_reflection(user_id, baseline_drift=baseline_drift)
+                    for user_id in user_batch
+                ]
                 batch_results = await asyncio.gather(*tasks, return_exceptions=True)
 
                 # Log batch completion
@@ -222,10 +235,15 @@ class ReflectionAgent:
 
         return report
 
-    async def process_user_reflection(self, user_id: str) -> UserReflectionResult:
+    async def process_user_reflection(
+        self,
+        user_id: str,
+        baseline_drift: Optional[Dict[str, Tuple[PADState, PADState]]] = None
+    ) -> UserReflectionResult:
         """
         Complete reflection process for a single user
         Includes memory consolidation, personality evolution, and pattern analysis
+        baseline_drift holds (old, new) baselines already drifted for the batch
         """
         result = UserReflectionResult(user_id=user_id, start_time=datetime.utcnow())
 
@@ -235,7 +253,7 @@ class ReflectionAgent:
             result.consolidation_result = consolidation_result
 
             # 2. Personality Evolution
-            personality_result = await self.evolve_user_personality(user_id)
+            personality_result = await self.evolve_user_personality(user_id, baseline_drift)
             result.personality_evolution = personality_result
 
             # 3. Pattern Analysis and Insights
@@ -440,7 +458,11 @@ class ReflectionAgent:
 
         return await self.memory.get_memory_by_id(user_id, semantic_memory_id)
 
-    async def evolve_user_personality(self, user_id: str) -> PersonalityEvolutionResult:
+    async def evolve_user_personality(
+        self,
+        user_id: str,
+        baseline_drift: Optional[Dict[str, Tuple[PADState, PADState]]] = None
+    ) -> PersonalityEvolutionResult:
         """
         Analyze and apply personality evolution based on recent behavioral patterns
         Updates PAD baseline drift and quirk strengths
@@ -458,7 +480,7 @@ class ReflectionAgent:
         result.behavioral_analysis = behavioral_analysis
 
         # Apply PAD baseline drift based on recent emotional patterns
-        drift_result = await self._apply_pad_baseline_drift(user_id)
+        drift_result = await self._apply_pad_baseline_drift(user_id, baseline_drift)
         result.pad_drift_applied = drift_result
 
         # Evolve quirks based on usage patterns
@@ -635,6 +657,10 @@ class ReflectionAgent:
                     reason="strength_too_low"
                 ))
 
+        if quirk_updates:
+            # Quirks were written directly; drop the engine's cached reads
+            self.personality.invalidate(user_id)
+
         result.quirk_updates = quirk_updates
         result.total_quirks_processed = len(active_quirks)
         result.quirks_strengthened = len([u for u in quirk_updates if u.new_strength > u.old_strength])
@@ -651,20 +677,30 @@ class ReflectionAgent:
             # Decrease confidence for lack of reinforcement
             return -0.01  # Small negative adjustment
 
-    async def _apply_pad_baseline_drift(self, user_id: str) -> Dict[str, float]:
+    async def _apply_pad_baseline_drift(
+        self,
+        user_id: str,
+        baseline_drift: Optional[Dict[str, Tuple[PADState, PADState]]] = None
+    ) -> Dict[str, float]:
         """
         Apply PAD baseline drift based on recent emotional patterns
         Uses the formula: new_baseline = current_baseline + (average_interaction_pad - current_baseline) * 0.01
+        When the batch drift already ran, its (old, new) baselines are reported instead
         """
-        # Get current baseline before drift
-        snapshot = await self.personality.get_personality_snapshot(user_id)
-        if not snapshot or not snapshot.current_pad or not snapshot.current_pad.pad_baseline:
-            return {}
+        if baseline_drift is not None:
+            if user_id not in baseline_drift:
+                return {}  # Not enough recent interactions to drift
+            old_baseline, new_baseline = baseline_drift[user_id]
+        else:
+            # Get current baseline before drift
+            snapshot = await self.personality.get_personality_snapshot(user_id)
+            if not snapshot or not snapshot.pad_baseline:
+                return {}
 
-        old_baseline = snapshot.current_pad.pad_baseline
+            old_baseline = snapshot.pad_baseline
 
-        # Apply drift via personality engine (which handles all calculations internally)
-        new_baseline = await self.personality.apply_pad_baseline_drift(user_id, drift_rate=0.01)
+            # Apply drift via personality engine (which handles all calculations internally)
+            new_baseline = await self.personality.apply_pad_baseline_drift(user_id, drift_rate=0.01)
 
         return {
             "old_pleasure": old_baseline.pleasure,
@@ -697,6 +733,10 @@ class ReflectionAgent:
                     "satisfaction_event_count": len(satisfaction_events)
                 })
         
+        if updates:
+            # Needs were written directly; drop the engine's cached reads
+            self.personality.invalidate(user_id)
+
         return {
             "need_updates": updates,
             "total_needs_updated": len(updates)
@@ -27,6 +27,10 @@ class Settings(BaseSettings):
         default="http://qdrant:6333",
         description="Qdrant vector database URL"
     )
+    qdrant_prefer_grpc: bool = Field(
+        default=True,
+        description="Use Qdrant's gRPC transport (port 6334) instead of REST/JSON where supported"
+    )
 
     # AI Service APIs
     chutes_api_key: SecretStr = Field(
@@ -153,6 +157,18 @@ class Settings(BaseSettings):
         le=100,
         description="Database connection pool maximum size"
     )
+    db_statement_cache_size: int = Field(
+        default=256,
+        ge=0,
+        le=4096,
+        description="Prepared statements cached per database connection (0 disables reuse)"
+    )
+    db_pool_max_inactive_lifetime: float = Field(
+        default=300.0,
+        ge=0.0,
+        le=3600.0,
+        description="Seconds an idle pooled database connection is kept before closing (0 keeps it forever)"
+    )
     redis_pool_size: int = Field(
         default=10,
         ge=1,
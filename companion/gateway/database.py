@@ -4,8 +4,9 @@ Handles connection pooling, user-scoped queries, and transaction management.
 """
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Sequence, Tuple, AsyncIterator
 import asyncpg
+import orjson
 import re
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -17,6 +18,91 @@ from .utils.query_executor import QueryExecutor
 logger = logging.getLogger(__name__)
 
 
+def _encode_json(value: Any) -> str:
+    """Encode a JSON/JSONB parameter; strings are passed through as JSON text."""
+    if isinstance(value, str):
+        return value
+    return orjson.dumps(value).decode()
+
+
+async def _init_connection(connection):
+    """Decode json/jsonb columns to Python objects and accept them as parameters."""
+    for type_name in ("json", "jsonb"):
+        await connection.set_type_codec(
+            type_name,
+            encoder=_encode_json,
+            decoder=orjson.loads,
+            schema="pg_catalog"
+        )
+
+
+def _user_profile_set_clause(updates: Dict[str, Any], touch_last_active: bool = False) -> str:
+    """
+    Build the SET clause of a user_profiles update; $1 is reserved for user_id.
+    With touch_last_active, last_active is set to the database server's NOW().
+    """
+    for column in updates:
+        if not re.fullmatch(r"[a-z_][a-z0-9_]*", column):
+            raise ValueError(f"Invalid user profile column: {column}")
+    assignments = [f"{column} = ${index}" for index, column in enumerate(updates, start=2)]
+    if touch_last_active:
+        assignments.append("last_active = NOW()")
+    return ", ".join(assignments)
+
+
+_INTERACTION_INSERT_QUERY = """
+INSERT INTO interactions (
+    user_id, user_message, agent_response, session_id,
+    pad_before, pad_after, emotion_before, emotion_after,
+    response_time_ms, token_count, llm_model_used,
+    is_proactive, proactive_trigger, proactive_score,
+    memories_retrieved, memories_stored,
+    error_occurred, error_message, fallback_used,
+    security_check_passed, security_threat_detected,
+    user_initiated, conversation_length, user_satisfaction_implied,
+    timestamp
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+          $11, $12, $13, $14, $15, $16, $17, $18, $19,
+          $20, $21, $22, $23, $24, $25)
+"""
+
+
+def _interaction_params(interaction) -> Tuple[Any, ...]:
+    """
+    Positional parameters of _INTERACTION_INSERT_QUERY for one interaction.
+    Metrics the record does not carry fall back to the interactions table defaults.
+    """
+    return (
+        interaction.user_id,
+        interaction.user_message,
+        interaction.agent_response,
+        interaction.session_id,
+        interaction.pad_before,
+        interaction.pad_after,
+        interaction.emotion_before,
+        interaction.emotion_after,
+        # response_time_ms is an INTEGER column
+        round(interaction.response_time_ms) if interaction.response_time_ms is not None else None,
+        getattr(interaction, "token_count", None),
+        getattr(interaction, "llm_model_used", None),
+        interaction.is_proactive,
+        interaction.proactive_trigger,
+        interaction.proactive_score,
+        interaction.memories_retrieved,
+        getattr(interaction, "memories_stored", 0),
+        getattr(interaction, "error_occurred", False),
+        getattr(interaction, "error_message", None),
+        getattr(interaction, "fallback_used", False),
+        getattr(interaction, "security_check_passed", True),
+        getattr(interaction, "security_threat_detected", None),
+        interaction.user_initiated,
+        interaction.conversation_length,
+        getattr(interaction, "user_satisfaction_implied", None),
+        # Inserts may be deferred, so keep the time the interaction happened
+        interaction.timestamp
+    )
+
+
 class DatabaseManager:
     """
     Manages database connections and user-scoped queries for the AI Companion System.
@@ -39,7 +125,12 @@ class DatabaseManager:
                 self.database_url,
                 min_size=self.settings.db_pool_min_size,
                 max_size=self.settings.db_pool_max_size,
-                command_timeout=60
+                # asyncpg prepares every query and reuses the plan for identical SQL text
+                # on the same connection; size the cache for all hot service queries
+                statement_cache_size=self.settings.db_statement_cache_size,
+                max_inactive_connection_lifetime=self.settings.db_pool_max_inactive_lifetime,
+                command_timeout=60,
+                init=_init_connection
             )
             self._initialized = True
             logger.info("Database connection pool initialized successfully")
@@ -90,6 +181,44 @@ class DatabaseManager:
         async with self.pool.acquire() as conn:
             return await QueryExecutor.execute_scoped_query(conn, query, user_id, params)
 
+    async def execute_user_fetchrow(self, user_id: str, query: str, params: Optional[tuple] = None) -> Any:
+        """
+        Execute a user-scoped query and return only its first row (or None).
+        Validated like execute_user_query.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not initialized")
+
+        async with self.pool.acquire() as conn:
+            return await QueryExecutor.fetch_scoped_row(conn, query, user_id, params)
+
+    async def iter_user_query(self, user_id: str, query: str, params: Optional[tuple] = None,
+                              prefetch: int = 100) -> AsyncIterator[Any]:
+        """
+        Stream a user-scoped query's rows through a server-side cursor, validated like execute_user_query.
+        A pool connection and its transaction are held until the stream is exhausted or closed,
+        so consume it promptly and close it (e.g. leave the async for) when stopping early.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not initialized")
+
+        # Cursors only live inside a transaction
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                async for record in QueryExecutor.iter_scoped_rows(conn, query, user_id, params, prefetch):
+                    yield record
+
+    async def execute_user_fetchval(self, user_id: str, query: str, params: Optional[tuple] = None) -> Any:
+        """
+        Execute a user-scoped query and return the first column of its first row (or None).
+        Validated like execute_user_query.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not initialized")
+
+        async with self.pool.acquire() as conn:
+            return await QueryExecutor.fetch_scoped_value(conn, query, user_id, params)
+
     async def execute_admin_query(self, query: str, params: Optional[tuple] = None) -> Any:
         """
         Execute an admin query that bypasses user scoping.
@@ -112,6 +241,25 @@ class DatabaseManager:
             result = await conn.fetch(query, user_id)
             return result[0] if result else None
 
+    async def update_user_profile(self, user_id: str, updates: Dict[str, Any],
+                                  touch_last_active: bool = False) -> bool:
+        """Update user profile fields. Returns False if the user does not exist."""
+        return await self.update_user_profile_returning(user_id, updates, touch_last_active) is not None
+
+    async def update_user_profile_returning(self, user_id: str, updates: Dict[str, Any],
+                                            touch_last_active: bool = False):
+        """Update user profile fields and return the updated row (None if the user does not exist)."""
+        if not updates and not touch_last_active:
+            return await self.get_user_profile(user_id)
+
+        query = f"""
+        UPDATE user_profiles SET {_user_profile_set_clause(updates, touch_last_active)}
+        WHERE user_id = $1
+        RETURNING *
+        """
+        async with self.pool.acquire() as conn:
+            return await conn.fetchrow(query, user_id, *updates.values())
+
     async def get_user_needs(self, user_id: str):
         """Get user needs by user_id with proper scoping."""
         query = "SELECT * FROM needs WHERE user_id = $1"
@@ -156,57 +304,24 @@ class DatabaseManager:
 
     async def log_interaction(self, interaction) -> bool:
         """Log an interaction with proper user scoping."""
-        query = """
-        INSERT INTO interactions (
-            user_id, user_message, agent_response, session_id,
-            pad_before, pad_after, emotion_before, emotion_after,
-            response_time_ms, token_count, llm_model_used,
-            is_proactive, proactive_trigger, proactive_score,
-            memories_retrieved, memories_stored,
-            error_occurred, error_message, fallback_used,
-            security_check_passed, security_threat_detected,
-            user_initiated, conversation_length, user_satisfaction_implied
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
-                  $11, $12, $13, $14, $15, $16, $17, $18, $19,
-                  $20, $21, $22, $23, $24) RETURNING id
-        """
-        params = (
-            interaction.user_id,
-            interaction.user_message,
-            interaction.agent_response,
-            interaction.session_id,
-            interaction.pad_before,
-            interaction.pad_after,
-            interaction.emotion_before,
-            interaction.emotion_after,
-            interaction.response_time_ms,
-            interaction.token_count,
-            interaction.llm_model_used,
-            interaction.is_proactive,
-            interaction.proactive_trigger,
-            interaction.proactive_score,
-            interaction.memories_retrieved,
-            interaction.memories_stored,
-            interaction.error_occurred,
-            interaction.error_message,
-            interaction.fallback_used,
-            interaction.security_check_passed,
-            interaction.security_threat_detected,
-            interaction.user_initiated,
-            interaction.conversation_length,
-            interaction.user_satisfaction_implied
-        )
-
         try:
             # Use direct pool execution to avoid duplicate user_id injection
             # INSERT already has explicit user_id in params
             async with self.pool.acquire() as conn:
-                result = await conn.fetchrow(query, *params)
+                await conn.execute(_INTERACTION_INSERT_QUERY, *_interaction_params(interaction))
             return True
         except Exception as e:
             logger.error(f"Error logging interaction for user {interaction.user_id}: {e}")
             return False
 
+    async def log_interactions_batch(self, interactions: Sequence[Any]) -> None:
+        """Insert many interactions in one round trip; raises if any row fails."""
+        async with self.pool.acquire() as conn:
+            await conn.executemany(
+                _INTERACTION_INSERT_QUERY,
+                [_interaction_params(interaction) for interaction in interactions]
+            )
+
     async def get_recent_interaction_stats(self, user_id: str, days: int = 7):
         """Get recent interaction statistics for a user."""
         # Validate days parameter
@@ -392,6 +507,15 @@ class DatabaseManager:
             result = await conn.fetch(query, limit, skip)
             return [dict(row) for row in result]
 
+    async def iter_all_users(self, skip: int = 0, limit: int = 50, prefetch: int = 200) -> AsyncIterator[asyncpg.Record]:
+        """Stream a page of users through a server-side cursor, newest first."""
+        query = "SELECT * FROM user_profiles ORDER BY created_at DESC LIMIT $1 OFFSET $2"
+        # Cursors only live inside a transaction
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                async for record in conn.cursor(query, limit, skip, prefetch=prefetch):
+                    yield record
+
     async def get_total_user_count(self) -> int:
         """Get the total count of users in the system."""
         query = "SELECT COUNT(*) as count FROM user_profiles"
@@ -502,6 +626,117 @@ class DatabaseTransaction:
         """Execute an admin query within this transaction (bypasses user scoping)."""
         return await QueryExecutor.execute_admin_query(self.connection, query, params)
 
+    async def insert_user_profile(self, profile) -> int:
+        """Insert a new user profile row within this transaction and return its id."""
+        return await self.connection.fetchval(
+            """
+            INSERT INTO user_profiles (
+                user_id, discord_username, status,
+                initialization_completed, personality_initialized
+            ) VALUES ($1, $2, $3, $4, $5)
+            RETURNING id
+            """,
+            profile.user_id,
+            profile.discord_username,
+            profile.status,
+            profile.initialization_completed,
+            profile.personality_initialized
+        )
+
+    async def update_user_profile(self, profile_id: int, updates: Dict[str, Any]) -> None:
+        """Update user profile fields by row id within this transaction; $1 is the row id."""
+        if not updates:
+            return
+        await self.connection.execute(
+            f"UPDATE user_profiles SET {_user_profile_set_clause(updates)} WHERE id = $1",
+            profile_id, *updates.values()
+        )
+
+    async def complete_user_profile(self, profile_id: int, updates: Dict[str, Any],
+                                    needs: Sequence[Tuple[str, float, float]]) -> None:
+        """
+        Update a new user's profile and seed their psychological needs in a single statement.
+        Needs are (need_type, current_level, baseline_level) rows; needs that already exist are left untouched.
+        """
+        needs_param = len(updates) + 2
+        need_types, current_levels, baseline_levels = (list(column) for column in zip(*needs))
+        await self.connection.execute(
+            f"""
+            WITH profile AS (
+                UPDATE user_profiles SET {_user_profile_set_clause(updates)}
+                WHERE id = $1
+                RETURNING user_id
+            )
+            INSERT INTO needs (user_id, need_type, current_level, baseline_level)
+            SELECT profile.user_id, n.need_type, n.current_level, n.baseline_level
+            FROM profile, unnest(${needs_param}::text[], ${needs_param + 1}::float8[], ${needs_param + 2}::float8[])
+                AS n(need_type, current_level, baseline_level)
+            ON CONFLICT (user_id, need_type) DO NOTHING
+            """,
+            profile_id, *updates.values(), need_types, current_levels, baseline_levels
+        )
+
+    async def insert_default_personalities(
+        self,
+        user_ids: Sequence[str],
+        state: Tuple[Any, ...],
+        quirks: Sequence[Tuple[str, str, str, float, float]],
+        needs: Sequence[Tuple[str, float, float, float]]
+    ) -> None:
+        """
+        Create the same starting personality, quirks and needs for many users within this transaction.
+        state is (openness, conscientiousness, extraversion, agreeableness, neuroticism,
+        pleasure, arousal, dominance, emotion_label, pad_baseline); quirks are
+        (name, category, description, strength, confidence) and needs are
+        (need_type, current_level, baseline_level, decay_rate). One statement per table,
+        whatever the cohort size.
+        """
+        user_ids = list(user_ids)
+        await self.connection.execute(
+            """
+            INSERT INTO personality_state
+            (user_id, openness, conscientiousness, extraversion, agreeableness, neuroticism,
+             pleasure, arousal, dominance, emotion_label, pad_baseline, is_current)
+            SELECT u.user_id, $2::float8, $3::float8, $4::float8, $5::float8, $6::float8,
+                   $7::float8, $8::float8, $9::float8, $10::text, $11::jsonb, TRUE
+            FROM unnest($1::text[]) AS u(user_id)
+            """,
+            user_ids, *state
+        )
+        await self.connection.execute(
+            """
+            INSERT INTO quirks (user_id, name, category, description, strength, confidence)
+            SELECT u.user_id, q.*
+            FROM unnest($1::text[]) AS u(user_id)
+            CROSS JOIN unnest($2::text[], $3::text[], $4::text[], $5::float8[], $6::float8[]) AS q
+            """,
+            user_ids, *(list(column) for column in zip(*quirks))
+        )
+        await self.connection.execute(
+            """
+            INSERT INTO needs (user_id, need_type, current_level, baseline_level, decay_rate)
+            SELECT u.user_id, n.*
+            FROM unnest($1::text[]) AS u(user_id)
+            CROSS JOIN unnest($2::text[], $3::float8[], $4::float8[], $5::float8[]) AS n
+            """,
+            user_ids, *(list(column) for column in zip(*needs))
+        )
+
+    async def insert_needs_batch(self, user_id: str, needs: Sequence[Tuple[str, float, float]]) -> None:
+        """
+        Insert a user's psychological needs in one batch within this transaction.
+        Rows are (need_type, current_level, baseline_level); needs that already exist are left untouched.
+        """
+        await self.connection.executemany(
+            """
+            INSERT INTO needs (user_id, need_type, current_level, baseline_level)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (user_id, need_type) DO NOTHING
+            """,
+            [(user_id, need_type, current_level, baseline_level)
+             for need_type, current_level, baseline_level in needs]
+        )
+
     async def execute(self, query: str, *args) -> Any:
         """Execute an arbitrary query within this transaction (bypasses user scoping like admin query)."""
         return await self.connection.execute(query, *args)
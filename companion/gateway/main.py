@@ -23,8 +23,8 @@ logger = logging.getLogger(__name__)
 from .config import Settings
 from .database import DatabaseManager
 
-# Import QdrantClient for vector database
-from qdrant_client import QdrantClient
+# Import AsyncQdrantClient for vector database
+from qdrant_client import AsyncQdrantClient
 import redis.asyncio as redis
 
 from .utils.exceptions import setup_exception_handlers
@@ -57,7 +57,7 @@ class ServiceContainer:
     def __init__(self):
         # Will be initialized during startup
         self.db: Optional[DatabaseManager] = None
-        self.qdrant: Optional[QdrantClient] = None  # Added Qdrant client
+        self.qdrant: Optional[AsyncQdrantClient] = None  # Added Qdrant client
         self.redis: Optional[redis.Redis] = None
         self.groq: Optional[GroqClient] = None
         self.chutes: Optional[ChutesClient] = None
@@ -84,7 +84,7 @@ services = ServiceContainer()
 def get_db() -> DatabaseManager:
     return services.db
 
-def get_qdrant() -> QdrantClient:
+def get_qdrant() -> AsyncQdrantClient:
     return services.qdrant
 
 def get_groq() -> GroqClient:
@@ -147,8 +147,15 @@ async def lifespan(app: FastAPI):
         await services.db.initialize()
         
         # Initialize Qdrant client for vector database
-        services.qdrant = QdrantClient(url=settings.qdrant_url)
-        logger.info(f"✅ Qdrant client initialized with URL: {settings.qdrant_url}")
+        # gRPC sends vectors as protobuf rather than JSON, which matters for bulk reads/writes
+        services.qdrant = AsyncQdrantClient(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc
+        )
+        logger.info(
+            f"✅ Qdrant client initialized with URL: {settings.qdrant_url} "
+            f"(prefer gRPC: {settings.qdrant_prefer_grpc})"
+        )
         
         services.redis = redis.from_url(
             settings.redis_url,
@@ -167,7 +174,7 @@ async def lifespan(app: FastAPI):
         if services.db:
             await services.db.close()
         if services.qdrant:
-            services.qdrant.close()
+            await services.qdrant.close()
         if services.redis:
             await services.redis.close()
         raise
@@ -217,7 +224,8 @@ async def lifespan(app: FastAPI):
         embedding_client=services.embedding_client,
         importance_scorer=services.importance_scorer,
         mmr_ranker=services.mmr,
-        db_manager=services.db
+        db_manager=services.db,
+        qdrant_url=settings.qdrant_url
     )
 
     services.letta = LettaService(
@@ -278,6 +286,10 @@ async def lifespan(app: FastAPI):
     if services.background:
         await services.background.stop()
 
+    # Flush buffered interactions and finish queued Letta agent deletions
+    if services.users:
+        await services.users.close()
+
     # Close Redis connection
     if services.redis:
         try:
@@ -288,7 +300,7 @@ async def lifespan(app: FastAPI):
 
     # Close Qdrant client
     if services.qdrant:
-        services.qdrant.close()
+        await services.qdrant.close()
 
     # Close database connection
     if services.db:
@@ -405,7 +417,7 @@ async def service_status():
     """Get overall service status and health."""
     return {
         "status": "healthy",
-        "timestamp": asyncio.get_event_loop().time(),
+        "timestamp": asyncio.get_running_loop().time(),
         "services_initialized": all([
             services.db is not None,
             services.qdrant is not None,  # Added check for Qdrant
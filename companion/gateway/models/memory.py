@@ -379,4 +379,36 @@ class ConsolidationBatch(BaseModel):
     consolidation_timestamp: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         description="When the consolidation occurred"
-    )
\ No newline at end of file
+    )
+
+class MigrationProgress(BaseModel):
+    """
+    Progress update emitted after each batch of a memory migration is committed.
+    """
+    source_user_id: str = Field(
+        ...,
+        description="User ID memories are being migrated from"
+    )
+    target_user_id: str = Field(
+        ...,
+        description="User ID memories are being migrated to"
+    )
+    collection: str = Field(
+        ...,
+        description="Target collection the batch was written to"
+    )
+    batch_count: int = Field(
+        ...,
+        ge=0,
+        description="Number of memories in this batch"
+    )
+    migrated_count: int = Field(
+        ...,
+        ge=0,
+        description="Total memories migrated so far across all collections"
+    )
+    total_estimate: int = Field(
+        ...,
+        ge=0,
+        description="Approximate number of memories in the source collections when migration started"
+    )
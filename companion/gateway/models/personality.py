@@ -12,6 +12,20 @@ from pydantic import BaseModel, Field, field_validator, ConfigDict
 import re
 
 
+# Emotion labels indexed by PAD octant: bit 2 = pleasure > 0, bit 1 = arousal > 0,
+# bit 0 = dominance > 0
+EMOTION_OCTANTS = (
+    "bored",        # -P -A -D
+    "disdainful",   # -P -A +D
+    "stressed",     # -P +A -D
+    "hostile",      # -P +A +D
+    "docile",       # +P -A -D
+    "relaxed",      # +P -A +D
+    "dependent",    # +P +A -D
+    "exuberant",    # +P +A +D
+)
+
+
 class BigFiveTraits(BaseModel):
     """
     The Big Five personality traits (OCEAN model).
@@ -96,18 +110,9 @@ class PADState(BaseModel):
         Returns:
             str: The emotion label corresponding to the current PAD state
         """
-        p, a, d = self.pleasure > 0, self.arousal > 0, self.dominance > 0
-        mapping = {
-            (True, True, True): "exuberant",
-            (True, True, False): "dependent",
-            (True, False, True): "relaxed",
-            (True, False, False): "docile",
-            (False, True, True): "hostile",
-            (False, True, False): "stressed",
-            (False, False, True): "disdainful",
-            (False, False, False): "bored"
-        }
-        return mapping.get((p, a, d), "neutral")
+        return EMOTION_OCTANTS[
+            (self.pleasure > 0) << 2 | (self.arousal > 0) << 1 | (self.dominance > 0)
+        ]
 
 
 class Quirk(BaseModel):
@@ -246,6 +251,39 @@ class PersonalitySnapshot(BaseModel):
     )
 
 
+class PADHistoryBucket(BaseModel):
+    """
+    Average PAD state over one time bucket, used for charting emotional history.
+    """
+    bucket_start: datetime = Field(
+        ...,
+        description="Start of the time bucket"
+    )
+    pleasure: float = Field(
+        ...,
+        ge=-1.0,
+        le=1.0,
+        description="Average pleasure in the bucket (-1.0 to 1.0)"
+    )
+    arousal: float = Field(
+        ...,
+        ge=-1.0,
+        le=1.0,
+        description="Average arousal in the bucket (-1.0 to 1.0)"
+    )
+    dominance: float = Field(
+        ...,
+        ge=-1.0,
+        le=1.0,
+        description="Average dominance in the bucket (-1.0 to 1.0)"
+    )
+    sample_count: int = Field(
+        ...,
+        ge=1,
+        description="Number of personality states averaged into the bucket"
+    )
+
+
 class QuirkEvolutionResult(BaseModel):
     """
     Result of quirk evolution process performed by reflection agent.
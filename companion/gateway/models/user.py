@@ -67,3 +67,13 @@ class UserProfile(BaseModel):
     class Config:
         # Allow arbitrary types for datetime
         arbitrary_types_allowed = True
+
+    @classmethod
+    def from_record(cls, record) -> "UserProfile":
+        """
+        Build a profile from a trusted user_profiles row without re-validating it.
+        Columns that are not profile fields are ignored; missing fields take their defaults.
+        """
+        return cls.model_construct(
+            **{name: value for name, value in dict(record).items() if name in cls.model_fields}
+        )
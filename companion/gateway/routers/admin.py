@@ -173,12 +173,14 @@ async def run_system_cleanup(
 async def migrate_user_memories(
     source_user_id: str,
     target_user_id: str,
+    delete_source: bool = Query(False),
     user_service: UserService = Depends(get_users),
     memory_manager: MemoryManager = Depends(get_memory)
 ):
     """
     Migrate memories from one user to another.
     Useful for account merging or data migration scenarios.
+    Set delete_source to move memories instead of copying them.
     """
     try:
         # Verify both users exist
@@ -194,7 +196,8 @@ async def migrate_user_memories(
         # Migrate memories
         migrated_count = await memory_manager.migrate_memories(
             source_user_id=source_user_id,
-            target_user_id=target_user_id
+            target_user_id=target_user_id,
+            delete_source=delete_source
         )
         
         logger.info(f"Migrated {migrated_count} memories from {source_user_id} to {target_user_id}")
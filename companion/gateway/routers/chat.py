@@ -32,6 +32,18 @@ router = APIRouter(tags=["chat"])
 logger = logging.getLogger(__name__)
 
 
+def _report_interaction_write(written: "asyncio.Future[bool]", interaction: InteractionRecord) -> None:
+    """Log when a queued interaction write does not land, without delaying the response."""
+    def report(future: "asyncio.Future[bool]") -> None:
+        if future.cancelled() or not future.result():
+            logger.warning(
+                f"Interaction for user {interaction.user_id} (session {interaction.session_id}) "
+                f"was not stored"
+            )
+
+    written.add_done_callback(report)
+
+
 @router.post("/message", response_model=ChatResponse)
 async def process_message(
     request: ChatRequest,
@@ -163,7 +175,8 @@ async def process_message(
         interaction_record.memories_retrieved = len(relevant_memories)
         
         # Store the completed interaction
-        await user_service.log_interaction(interaction_record)
+        # Written in the next batch; a failed write is reported when it resolves
+        _report_interaction_write(user_service.log_interaction(interaction_record), interaction_record)
         
         # Store the user's message as a memory
         await memory_manager.store_memory(
@@ -317,7 +330,8 @@ async def initiate_proactive_conversation(
             user_initiated=False
         )
         
-        await user_service.log_interaction(interaction_record)
+        # Written in the next batch; a failed write is reported when it resolves
+        _report_interaction_write(user_service.log_interaction(interaction_record), interaction_record)
         
         logger.info(f"Proactive conversation initiated for user {user_id}")
         
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 import logging
 
 from ..models.personality import (
-    PersonalitySnapshot, PADState, BigFiveTraits, Quirk, PsychologicalNeed
+    PersonalitySnapshot, PADState, BigFiveTraits, Quirk, PsychologicalNeed, PADHistoryBucket
 )
 from ..models.user import UserProfile
 from ..services.personality_engine import PersonalityEngine
@@ -62,12 +62,13 @@ async def get_current_personality(
 async def get_personality_history(
     user_id: str,
     days: int = Query(7, ge=1, le=365),
+    limit: int = Query(100, ge=1, le=1000),
     personality_engine: PersonalityEngine = Depends(get_personality),
     user_service: UserService = Depends(get_users)
 ):
     """
     Get historical personality states for a user over the specified number of days.
-    Returns PAD states with timestamps.
+    Returns up to `limit` PAD states with timestamps, most recent first.
     """
     try:
         # Verify user exists
@@ -76,7 +77,7 @@ async def get_personality_history(
             raise HTTPException(status_code=404, detail=f"User {user_id} not found")
         
         # Get historical personality data
-        history = await personality_engine.get_personality_history(user_id, days=days)
+        history = await personality_engine.get_personality_history(user_id, days=days, limit=limit)
         
         return history
         
@@ -89,6 +90,34 @@ async def get_personality_history(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/history/{user_id}/chart", response_model=List[PADHistoryBucket])
+async def get_personality_history_chart(
+    user_id: str,
+    days: int = Query(7, ge=1, le=365),
+    bucket: str = Query("hour", pattern="^(hour|day|week)$"),
+    personality_engine: PersonalityEngine = Depends(get_personality),
+    user_service: UserService = Depends(get_users)
+):
+    """
+    Get a user's PAD history averaged into hourly, daily or weekly buckets for charting.
+    """
+    try:
+        # Verify user exists
+        user = await user_service.get_user_profile(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+        
+        return await personality_engine.get_pad_history_buckets(user_id, days=days, bucket=bucket)
+        
+    except UserNotFoundError:
+        raise HTTPException(status_code=404, detail=f"User {user_id} not found")
+    except PersonalityEngineError as e:
+        raise HTTPException(status_code=500, detail=f"Personality engine error: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error getting personality history chart for {user_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/quirks/{user_id}", response_model=List[Quirk])
 async def get_user_quirks(
     user_id: str,
@@ -6,16 +6,19 @@ using the MMR algorithm, and managing memory consolidation and conflict detectio
 """
 
 import asyncio
+import functools
 import logging
+import time
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     PointStruct, VectorParams, Distance, SearchParams,
-    PayloadSchemaType, Filter, FieldCondition, MatchValue
+    PayloadSchemaType, Filter, FieldCondition, MatchValue,
+    Range, PointIdsList
 )
-from ..models.memory import EpisodicMemory, SemanticMemory, MemoryConflict
+from ..models.memory import EpisodicMemory, SemanticMemory, MemoryConflict, MigrationProgress
 from ..database import DatabaseManager
 from ..utils.mmr import MaximalMarginalRelevance
 from ..utils.importance_scorer import ImportanceScorer
@@ -23,6 +26,25 @@ from ..services.embedding_client import EmbeddingClient
 from ..utils.exceptions import MemoryManagerError, MemoryConflictError
 
 
+# Default migration page size targets roughly this many vector components
+# (~8MB of float32) per scroll, clamped to a sensible range
+MIGRATION_PAGE_VECTOR_BUDGET = 2_000_000
+MIN_MIGRATION_BATCH_SIZE = 256
+MAX_MIGRATION_BATCH_SIZE = 8000
+
+# Number of concurrent scroll pipelines per collection during migration
+MIGRATION_SCROLL_SHARDS = 4
+
+# Committed batches a streaming migration may report ahead of its consumer
+MIGRATION_PROGRESS_QUEUE_SIZE = 16
+
+# How long a collection existence check is trusted before asking Qdrant again
+COLLECTION_EXISTS_TTL_SECONDS = 5.0
+
+# Maximum concurrent per-collection requests when totalling memories
+MEMORY_COUNT_CONCURRENCY = 16
+
+
 class MemoryManager:
     """
     Manages all memory operations including storage, retrieval, consolidation,
@@ -31,11 +53,12 @@ class MemoryManager:
     
     def __init__(
         self,
-        qdrant_client: QdrantClient,
+        qdrant_client: AsyncQdrantClient,
         embedding_client: EmbeddingClient,
         importance_scorer: ImportanceScorer,
         db_manager: DatabaseManager,
-        mmr_ranker: MaximalMarginalRelevance
+        mmr_ranker: MaximalMarginalRelevance,
+        qdrant_url: Optional[str] = None
     ):
         """
         Initialize the memory manager with required dependencies.
@@ -46,13 +69,18 @@ class MemoryManager:
             importance_scorer: Service for scoring memory importance
             db_manager: Database manager for metadata storage
             mmr_ranker: MMR algorithm implementation for diverse retrieval
+            qdrant_url: Base URL the Qdrant server can reach itself on; enables
+                server-side snapshot copies during migration (optional)
         """
         self.qdrant = qdrant_client
         self.embeddings = embedding_client
         self.scorer = importance_scorer
         self.db = db_manager
         self.mmr = mmr_ranker
+        self.qdrant_url = qdrant_url
         self.logger = logging.getLogger(__name__)
+        # collection name -> (monotonic time checked, exists)
+        self._exists_cache: Dict[str, Tuple[float, bool]] = {}
     
     async def store_memory(
         self,
@@ -145,12 +173,7 @@ class MemoryManager:
                 }
             )
             
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.qdrant.upsert,
-                collection_name,
-                [point]
-            )
+            await self.qdrant.upsert(collection_name, [point])
             
             # Store metadata in PostgreSQL
             await self.db.store_memory_metadata(user_id, memory)
@@ -176,43 +199,60 @@ class MemoryManager:
             collection_name: Name of the collection to ensure
         """
         try:
-            # Check if collection exists
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.qdrant.get_collections
-            )
-            
-            collection_names = [collection.name for collection in collections.collections]
-            if collection_name not in collection_names:
-                # Create collection with 1536-dim vectors and cosine distance
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.qdrant.create_collection,
-                    collection_name,
-                    VectorParams(size=getattr(self.embeddings, "dimensions", 1536), distance=Distance.COSINE)
-                )
+            if not await self._collection_exists(collection_name):
+                await self._create_collection(collection_name)
+        except Exception as e:
+            self.logger.warning(f"Failed to ensure collection {collection_name} exists: {e}")
 
-                # Create payload field indexes for efficient filtering
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.qdrant.create_payload_index,
-                    collection_name,
-                    "user_id",
-                    PayloadSchemaType.KEYWORD  # Index user_id as keyword for exact matching
-                )
+    async def _collection_exists(self, collection_name: str) -> bool:
+        """
+        Check whether a Qdrant collection exists.
 
-                # Index importance and recency scores for ranking
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    self.qdrant.create_payload_index,
-                    collection_name,
-                    "importance_score",
-                    PayloadSchemaType.FLOAT
-                )
+        Results are cached for a few seconds, since store_memory checks on every write.
 
-                self.logger.info(f"Created Qdrant collection {collection_name} with payload indexes")
-        except Exception as e:
-            self.logger.warning(f"Failed to ensure collection {collection_name} exists: {e}")
+        Args:
+            collection_name: Name of the collection to check
+
+        Returns:
+            True if the collection exists, False otherwise
+        """
+        cached = self._exists_cache.get(collection_name)
+        if cached is not None and time.monotonic() - cached[0] < COLLECTION_EXISTS_TTL_SECONDS:
+            return cached[1]
+
+        exists = await self.qdrant.collection_exists(collection_name)
+        self._exists_cache[collection_name] = (time.monotonic(), exists)
+        return exists
+
+    async def _create_collection(self, collection_name: str):
+        """
+        Create a memory collection with its payload indexes.
+
+        Args:
+            collection_name: Name of the collection to create
+        """
+        # Create collection with 1536-dim vectors and cosine distance
+        await self.qdrant.create_collection(
+            collection_name,
+            VectorParams(size=getattr(self.embeddings, "dimensions", 1536), distance=Distance.COSINE)
+        )
+
+        # Create payload field indexes for efficient filtering
+        await self.qdrant.create_payload_index(
+            collection_name,
+            "user_id",
+            PayloadSchemaType.KEYWORD  # Index user_id as keyword for exact matching
+        )
+
+        # Index importance and recency scores for ranking
+        await self.qdrant.create_payload_index(
+            collection_name,
+            "importance_score",
+            PayloadSchemaType.FLOAT
+        )
+
+        self._exists_cache[collection_name] = (time.monotonic(), True)
+        self.logger.info(f"Created Qdrant collection {collection_name} with payload indexes")
     
     async def search_memories(
         self,
@@ -251,17 +291,14 @@ class MemoryManager:
                 try:
                     # Use query_filter for efficient database-level filtering
                     # Use query_filter for efficient database-level filtering
-                    results = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda cname=collection_name, qvec=query_vector: self.qdrant.search(
-                            collection_name=cname,
-                            query_vector=qvec,
-                            limit=k * 2,  # Get more candidates for MMR
-                            query_filter=Filter(
-                                must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
-                            ),
-                            score_threshold=0.3
-                        )
+                    results = await self.qdrant.search(
+                        collection_name=collection_name,
+                        query_vector=query_vector,
+                        limit=k * 2,  # Get more candidates for MMR
+                        query_filter=Filter(
+                            must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
+                        ),
+                        score_threshold=0.3
                     )
                     
                     for result in results:
@@ -338,15 +375,12 @@ class MemoryManager:
             
             for collection_name in collection_names:
                 try:
-                    results = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda cname=collection_name: self.qdrant.search(
-                            collection_name=cname,
-                            query_vector=query_vector,
-                            limit=candidate_count,
-                            score_threshold=0.3,
-                            params=SearchParams(exact=False)
-                        )
+                    results = await self.qdrant.search(
+                        collection_name=collection_name,
+                        query_vector=query_vector,
+                        limit=candidate_count,
+                        score_threshold=0.3,
+                        params=SearchParams(exact=False)
                     )
                     
                     for result in results:
@@ -434,12 +468,7 @@ class MemoryManager:
             deleted = False
             for collection_name in collection_names:
                 try:
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        self.qdrant.delete,
-                        collection_name,
-                        [memory_id]
-                    )
+                    await self.qdrant.delete(collection_name, [memory_id])
                     deleted = True
                 except Exception as e:
                     self.logger.debug(f"Failed to delete memory {memory_id} from {collection_name}: {e}")
@@ -576,12 +605,9 @@ class MemoryManager:
 
             # Get current point to retrieve access_count
             try:
-                points = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.retrieve(
-                        collection_name=collection_name,
-                        ids=[memory_id]
-                    )
+                points = await self.qdrant.retrieve(
+                    collection_name=collection_name,
+                    ids=[memory_id]
                 )
 
                 if points and len(points) > 0:
@@ -603,17 +629,14 @@ class MemoryManager:
                         new_recency_score = 1.0
 
                     # Update payload with new statistics
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda: self.qdrant.set_payload(
-                            collection_name=collection_name,
-                            payload={
-                                "access_count": current_access_count + 1,
-                                "last_accessed": now.isoformat(),
-                                "recency_score": new_recency_score
-                            },
-                            points=[memory_id]
-                        )
+                    await self.qdrant.set_payload(
+                        collection_name=collection_name,
+                        payload={
+                            "access_count": current_access_count + 1,
+                            "last_accessed": now.isoformat(),
+                            "recency_score": new_recency_score
+                        },
+                        points=[memory_id]
                     )
 
                     self.logger.debug(f"Updated Qdrant payload for memory {memory_id} (access_count: {current_access_count + 1}, recency: {new_recency_score:.3f})")
@@ -670,9 +693,7 @@ class MemoryManager:
             updated_count = 0
 
             # Get all user collections
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, self.qdrant.get_collections
-            )
+            collections = await self.qdrant.get_collections()
 
             for collection in collections.collections:
                 if collection.name.startswith('episodic_') or collection.name.startswith('semantic_'):
@@ -708,9 +729,7 @@ class MemoryManager:
             deleted_count = 0
 
             # Get all user collections
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, self.qdrant.get_collections
-            )
+            collections = await self.qdrant.get_collections()
 
             for collection in collections.collections:
                 if collection.name.startswith('episodic_') or collection.name.startswith('semantic_'):
@@ -728,6 +747,8 @@ class MemoryManager:
         """
         Get the total count of memories across all users.
 
+        The total uses Qdrant's approximate per-collection counts.
+
         Returns:
             Total number of memories in all collections
         """
@@ -735,17 +756,24 @@ class MemoryManager:
             total_count = 0
 
             # Get all collections
-            collections = await asyncio.get_event_loop().run_in_executor(
-                None, self.qdrant.get_collections
+            collections = await self.qdrant.get_collections()
+            memory_collection_names = (
+                collection.name for collection in collections.collections
+                if collection.name.startswith(('episodic_', 'semantic_'))
             )
 
-            # Sum up the point counts from all memory collections
-            for collection in collections.collections:
-                if collection.name.startswith('episodic_') or collection.name.startswith('semantic_'):
-                    collection_info = await asyncio.get_event_loop().run_in_executor(
-                        None, self.qdrant.get_collection, collection.name
-                    )
-                    total_count += collection_info.points_count
+            # Count collections concurrently, but cap in-flight requests
+            semaphore = asyncio.Semaphore(MEMORY_COUNT_CONCURRENCY)
+
+            async def count_points(collection_name: str) -> int:
+                async with semaphore:
+                    # Approximate count is served from the index, without the full collection info
+                    result = await self.qdrant.count(collection_name=collection_name, exact=False)
+                    return result.count
+
+            # Sum up the point counts from all memory collections as they arrive
+            for counted in asyncio.as_completed([count_points(name) for name in memory_collection_names]):
+                total_count += await counted
 
             self.logger.debug(f"Total memory count across all users: {total_count}")
             return total_count
@@ -753,166 +781,526 @@ class MemoryManager:
             self.logger.error(f"Failed to get total memory count: {e}")
             return 0
 
-    async def migrate_memories(self, source_user_id: str, target_user_id: str) -> int:
+    async def migrate_memories(
+        self,
+        source_user_id: str,
+        target_user_id: str,
+        batch_size: Optional[int] = None,
+        upsert_batch_size: Optional[int] = None,
+        scroll_shards: int = MIGRATION_SCROLL_SHARDS,
+        delete_source: bool = False
+    ) -> int:
         """
         Migrate all memories from one user to another.
         Useful for account merging or data migration scenarios.
         
-        ⚠️  WARNING: This operation is NOT atomic. If migration fails partway through,
-        some memories may be duplicated in the target collection without being removed
-        from the source. Manual cleanup may be required.
+        ⚠️  WARNING: By default this copies memories and is NOT atomic. If migration
+        fails partway through, some memories may be duplicated in the target collection
+        without being removed from the source. Manual cleanup may be required.
+
+        With delete_source=True each batch is removed from the source once it has been
+        verified in the target, so after a failure the source holds exactly the
+        memories that still need migrating and the migration can simply be re-run.
         
         Consider running this operation during maintenance windows and verifying
         results before deleting source collections.
 
+        Use migrate_memories_stream to observe progress while the migration runs.
+
         Args:
             source_user_id: The user ID to migrate memories from
             target_user_id: The user ID to migrate memories to
+            batch_size: Points fetched per scroll page (defaults to a size derived
+                from the embedding dimensions)
+            upsert_batch_size: Maximum points per upsert request, for targets with a
+                smaller request size limit than the scroll page (defaults to batch_size)
+            scroll_shards: Number of disjoint scroll pipelines to run per collection
+            delete_source: Move rather than copy, deleting each verified batch from
+                the source collection
 
         Returns:
             Number of memories migrated
         """
+        migrated_count = 0
+        async for progress in self.migrate_memories_stream(
+            source_user_id,
+            target_user_id,
+            batch_size=batch_size,
+            upsert_batch_size=upsert_batch_size,
+            scroll_shards=scroll_shards,
+            delete_source=delete_source
+        ):
+            migrated_count = progress.migrated_count
+        return migrated_count
+
+    async def migrate_memories_stream(
+        self,
+        source_user_id: str,
+        target_user_id: str,
+        batch_size: Optional[int] = None,
+        upsert_batch_size: Optional[int] = None,
+        scroll_shards: int = MIGRATION_SCROLL_SHARDS,
+        delete_source: bool = False
+    ) -> AsyncIterator[MigrationProgress]:
+        """
+        Migrate all memories from one user to another, yielding progress per batch.
+
+        Takes the same arguments as migrate_memories. Closing the iterator early
+        cancels the migration; with delete_source=True it can be resumed later.
+
+        Args:
+            source_user_id: The user ID to migrate memories from
+            target_user_id: The user ID to migrate memories to
+            batch_size: Points fetched per scroll page
+            upsert_batch_size: Maximum points per upsert request
+            scroll_shards: Number of disjoint scroll pipelines to run per collection
+            delete_source: Move rather than copy, deleting each verified batch from
+                the source collection
+
+        Yields:
+            MigrationProgress after each batch is committed to the target
+        """
         try:
-            migrated_count = 0
-            # Track the point IDs that have been migrated successfully
-            migrated_point_ids = []
+            batch_size = batch_size or self._default_migration_batch_size()
+            upsert_batch_size = upsert_batch_size or batch_size
 
-            # Migrate episodic memories
             source_episodic = self._sanitize_collection_name(f"episodic_{source_user_id}")
             target_episodic = self._sanitize_collection_name(f"episodic_{target_user_id}")
+            source_semantic = self._sanitize_collection_name(f"semantic_{source_user_id}")
+            target_semantic = self._sanitize_collection_name(f"semantic_{target_user_id}")
 
-            if await self._collection_exists(source_episodic):
-                # Create target collection if it doesn't exist
-                if not await self._collection_exists(target_episodic):
-                    await self._create_collection(target_episodic)
+            # Check all four collections once, concurrently, and reuse the answers below
+            collection_names = (source_episodic, target_episodic, source_semantic, target_semantic)
+            exists = dict(zip(
+                collection_names,
+                await asyncio.gather(*(self._collection_exists(name) for name in collection_names))
+            ))
+
+            pairs = [
+                (source, target)
+                for source, target in ((source_episodic, target_episodic), (source_semantic, target_semantic))
+                if exists[source]
+            ]
+
+            # Approximate source size so callers can show progress against a total
+            source_counts = await asyncio.gather(*(
+                self.qdrant.count(collection_name=source, exact=False) for source, _ in pairs
+            ))
+            total_estimate = sum(result.count for result in source_counts)
+
+            # Episodic and semantic collections are independent, so migrate them concurrently.
+            # Each committed batch reports (target collection, batch size) on the queue, which
+            # is bounded so the migration waits for a consumer that falls behind.
+            progress: asyncio.Queue = asyncio.Queue(maxsize=MIGRATION_PROGRESS_QUEUE_SIZE)
+            tasks = [
+                asyncio.create_task(self._migrate_collection(
+                    source, target, exists[target], batch_size, upsert_batch_size,
+                    scroll_shards, delete_source, progress
+                ))
+                for source, target in pairs
+            ]
+
+            async def run_migration():
+                # End the progress loop once every collection is done or one has failed;
+                # a failure is re-raised when the migration is awaited below
+                try:
+                    await self._run_until_first_failure(tasks)
+                except Exception:
+                    await progress.put(None)
+                    raise
+                await progress.put(None)
 
-                # Paginate through all points in source collection
-                next_offset = None
-                batch_size = 1000
+            migration = asyncio.create_task(run_migration())
 
-                while True:
-                    # Get batch of points from source collection
-                    scroll_result = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda offset=next_offset: self.qdrant.scroll(
-                            collection_name=source_episodic,
-                            limit=batch_size,
-                            offset=offset
-                        )
+            migrated_count = 0
+            try:
+                while (batch := await progress.get()) is not None:
+                    collection, batch_count = batch
+                    migrated_count += batch_count
+                    yield MigrationProgress(
+                        source_user_id=source_user_id,
+                        target_user_id=target_user_id,
+                        collection=collection,
+                        batch_count=batch_count,
+                        migrated_count=migrated_count,
+                        total_estimate=total_estimate
                     )
+                # Surface any failure from the migration itself
+                await migration
+            finally:
+                # If the caller stopped iterating, cancel the collection migrations and
+                # wait until they have stopped writing
+                if not migration.done():
+                    for task in (migration, *tasks):
+                        task.cancel()
+                    await asyncio.gather(migration, *tasks, return_exceptions=True)
+
+            for _, target in pairs:
+                exists[target] = True
+
+            # Perform validation to ensure migration was successful
+            # Count source and target collections concurrently
+            existing_collections = [name for name in collection_names if exists[name]]
+            counts = dict(zip(
+                existing_collections,
+                await asyncio.gather(*(
+                    self.qdrant.count(collection_name=name) for name in existing_collections
+                ))
+            ))
+
+            total_source_points = sum(
+                counts[name].count for name in (source_episodic, source_semantic) if name in counts
+            )
+            total_target_points = sum(
+                counts[name].count for name in (target_episodic, target_semantic) if name in counts
+            )
 
-                    points, next_offset = scroll_result
+            self.logger.info(f"Migrated {migrated_count} memories from {source_user_id} to {target_user_id}")
+            self.logger.info(f"Source collection count: {total_source_points}, Target collection count: {total_target_points}")
+        except Exception as e:
+            self.logger.error(f"Failed to migrate memories from {source_user_id} to {target_user_id}: {e}")
+            # Note: In a real implementation, you might want to implement rollback here
+            raise
 
-                    # Break if no more points
-                    if not points:
-                        break
+    def _default_migration_batch_size(self) -> int:
+        """
+        Pick a scroll page size that keeps each page's vectors around a fixed size.
 
-                    # Re-upload points to target collection
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda pts=points: self.qdrant.upsert(
-                            collection_name=target_episodic,
-                            points=pts
-                        )
+        Returns:
+            Number of points to fetch per scroll page
+        """
+        dimensions = getattr(self.embeddings, "dimensions", 1536) or 1536
+        batch_size = MIGRATION_PAGE_VECTOR_BUDGET // dimensions
+        return max(MIN_MIGRATION_BATCH_SIZE, min(MAX_MIGRATION_BATCH_SIZE, batch_size))
+
+    async def _migrate_collection(
+        self,
+        source_collection: str,
+        target_collection: str,
+        target_exists: bool,
+        batch_size: int,
+        upsert_batch_size: int,
+        scroll_shards: int,
+        delete_source: bool,
+        progress: Optional[asyncio.Queue] = None
+    ) -> int:
+        """
+        Copy every point from one collection into another.
+
+        When the target does not exist yet (and the source is being kept) the copy
+        is done server-side from a snapshot of the source, so vectors never pass
+        through this process. Otherwise (or if the snapshot path fails) points are
+        streamed across.
+
+        Args:
+            source_collection: Collection to read points from
+            target_collection: Collection to copy points into
+            target_exists: Whether the target collection already exists
+            batch_size: Points fetched per scroll page when streaming
+            upsert_batch_size: Maximum points per upsert request when streaming
+            scroll_shards: Number of concurrent scroll pipelines when streaming
+            delete_source: Delete each verified batch from the source
+            progress: Queue receiving (target collection, point count) per committed batch
+
+        Returns:
+            Number of points copied
+        """
+        if not target_exists:
+            # Snapshot copies are all-or-nothing, so moves always stream batch by batch
+            if self.qdrant_url and not delete_source:
+                try:
+                    copied = await self._copy_collection_via_snapshot(source_collection, target_collection)
+                    if progress is not None:
+                        await progress.put((target_collection, copied))
+                    return copied
+                except Exception as e:
+                    self.logger.warning(
+                        f"Snapshot copy of {source_collection} failed, falling back to streaming: {e}"
                     )
-                    
-                    # Track the point IDs that have been migrated
-                    migrated_point_ids.extend([point.id for point in points])
-                    migrated_count += len(points)
 
-                    # Break if no more pages
-                    if next_offset is None:
-                        break
+            # Create target collection if it doesn't exist (a failed recovery may have created it)
+            if not await self._collection_exists(target_collection):
+                await self._create_collection(target_collection)
 
-            # Migrate semantic memories
-            source_semantic = self._sanitize_collection_name(f"semantic_{source_user_id}")
-            target_semantic = self._sanitize_collection_name(f"semantic_{target_user_id}")
+        return await self._stream_collection(
+            source_collection, target_collection, batch_size, upsert_batch_size,
+            scroll_shards, delete_source, progress
+        )
+
+    async def _copy_collection_via_snapshot(self, source_collection: str, target_collection: str) -> int:
+        """
+        Create a new collection from a snapshot of another, entirely server-side.
+
+        Args:
+            source_collection: Collection to snapshot
+            target_collection: Collection to recover the snapshot into (must not exist)
+
+        Returns:
+            Number of points in the recovered collection
+        """
+        snapshot = await self.qdrant.create_snapshot(collection_name=source_collection)
+
+        try:
+            location = f"{self.qdrant_url.rstrip('/')}/collections/{source_collection}/snapshots/{snapshot.name}"
+            await self.qdrant.recover_snapshot(collection_name=target_collection, location=location)
+        finally:
+            # Recovery creates the target (possibly partially, on failure), so re-check it next time
+            self._exists_cache.pop(target_collection, None)
+            # Snapshots are full copies on the server's disk; don't leave them behind
+            await self.qdrant.delete_snapshot(
+                collection_name=source_collection,
+                snapshot_name=snapshot.name
+            )
+
+        recovered = await self.qdrant.count(collection_name=target_collection)
+        self.logger.info(f"Recovered {target_collection} from snapshot {snapshot.name} of {source_collection}")
+        return recovered.count
+
+    async def _run_until_first_failure(self, tasks: List[asyncio.Task]) -> List[Any]:
+        """
+        Wait for tasks to finish, cancelling the rest as soon as one of them fails.
+
+        Cancelled siblings are awaited before returning, so nothing is still writing
+        when the failure reaches the caller. Cancelling this coroutine cancels every task.
+
+        Args:
+            tasks: Tasks to supervise
+
+        Returns:
+            Task results, in the order the tasks were given
+        """
+        try:
+            if tasks:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Retrieve every failure so none is reported as unhandled, then raise the first
+        errors = [task.exception() for task in tasks if not task.cancelled()]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [task.result() for task in tasks]
+
+    async def _stream_collection(
+        self,
+        source_collection: str,
+        target_collection: str,
+        batch_size: int,
+        upsert_batch_size: int,
+        scroll_shards: int,
+        delete_source: bool,
+        progress: Optional[asyncio.Queue] = None
+    ) -> int:
+        """
+        Stream every point from one collection into another through this process.
+
+        The source is split into disjoint shards that are scrolled and upserted
+        concurrently, so the copy isn't limited to a single serial scroll cursor.
 
-            if await self._collection_exists(source_semantic):
-                # Create target collection if it doesn't exist
-                if not await self._collection_exists(target_semantic):
-                    await self._create_collection(target_semantic)
+        Args:
+            source_collection: Collection to read points from
+            target_collection: Collection to upsert points into
+            batch_size: Points fetched per scroll page
+            upsert_batch_size: Maximum points per upsert request
+            scroll_shards: Number of disjoint shards to scroll concurrently
+            delete_source: Delete each verified batch from the source
+            progress: Queue receiving (target collection, point count) per committed batch
+
+        Returns:
+            Number of points copied
+        """
+        tasks = [
+            asyncio.create_task(self._stream_shard(
+                source_collection, target_collection, shard_filter, batch_size,
+                upsert_batch_size, delete_source, progress
+            ))
+            for shard_filter in self._migration_shard_filters(scroll_shards)
+        ]
+        # Don't leave the other shards copying (or deleting) after one has failed
+        copied = sum(await self._run_until_first_failure(tasks))
+
+        if delete_source:
+            # Every verified batch was deleted, so anything left was never scrolled
+            remaining = await self.qdrant.count(collection_name=source_collection, exact=True)
+            if remaining.count:
+                raise MemoryManagerError(
+                    message=(
+                        f"{remaining.count} points were not migrated from {source_collection}; "
+                        f"they are still in the source"
+                    ),
+                    operation="migrate_memories"
+                )
 
-                # Paginate through all points in source collection
-                next_offset = None
-                batch_size = 1000
+        return copied
+
+    def _migration_shard_filters(self, shards: int) -> List[Optional[Filter]]:
+        """
+        Build scroll filters that partition a memory collection into disjoint shards.
+
+        Qdrant can't filter scrolls by point ID range, so shards are ranges over the
+        indexed importance_score payload field, plus a catch-all shard for points whose
+        importance_score is missing or not a number. A point holding an array of
+        scores can match several ranges; it is then upserted more than once under
+        the same ID, which is harmless.
+
+        Args:
+            shards: Number of importance_score ranges to split into
 
+        Returns:
+            Scroll filters covering every point exactly once ([None] for no sharding)
+        """
+        if shards <= 1:
+            return [None]
+
+        bounds = [i / shards for i in range(1, shards)]
+        ranges = [Range(lt=bounds[0])]
+        ranges.extend(Range(gte=low, lt=high) for low, high in zip(bounds, bounds[1:]))
+        ranges.append(Range(gte=bounds[-1]))
+
+        range_conditions = [
+            FieldCondition(key="importance_score", range=score_range) for score_range in ranges
+        ]
+        filters = [Filter(must=[condition]) for condition in range_conditions]
+        # Everything no range shard matches: empty, missing or non-numeric scores
+        filters.append(Filter(must_not=range_conditions))
+        return filters
+
+    async def _stream_shard(
+        self,
+        source_collection: str,
+        target_collection: str,
+        scroll_filter: Optional[Filter],
+        batch_size: int,
+        upsert_batch_size: int,
+        delete_source: bool,
+        progress: Optional[asyncio.Queue] = None
+    ) -> int:
+        """
+        Stream the points matching a filter from one collection into another.
+
+        Scrolling and upserting are pipelined through a small bounded queue so the
+        next page is fetched from the source while the previous page is uploaded
+        to the target.
+
+        Args:
+            source_collection: Collection to read points from
+            target_collection: Collection to upsert points into
+            scroll_filter: Filter selecting this shard's points (None for all points)
+            batch_size: Points fetched per scroll page
+            upsert_batch_size: Maximum points per upsert request
+            delete_source: Delete each batch from the source once it is verified in the target
+            progress: Queue receiving (target collection, point count) per committed batch
+
+        Returns:
+            Number of points copied
+        """
+        # Bounded so at most a couple of pages are held in memory at once
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        # Bind the static scroll arguments once; each page only supplies its offset
+        scroll_page = functools.partial(
+            self.qdrant.scroll,
+            collection_name=source_collection,
+            scroll_filter=scroll_filter,
+            limit=batch_size,
+            # Vectors are off by default on scroll but must be copied
+            with_payload=True,
+            with_vectors=True
+        )
+
+        async def producer():
+            next_offset = None
+            try:
                 while True:
                     # Get batch of points from source collection
-                    scroll_result = await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda offset=next_offset: self.qdrant.scroll(
-                            collection_name=source_semantic,
-                            limit=batch_size,
-                            offset=offset
-                        )
-                    )
-
-                    points, next_offset = scroll_result
+                    points, next_offset = await scroll_page(offset=next_offset)
 
                     # Break if no more points
                     if not points:
                         break
 
-                    # Re-upload points to target collection
-                    await asyncio.get_event_loop().run_in_executor(
-                        None,
-                        lambda pts=points: self.qdrant.upsert(
-                            collection_name=target_semantic,
-                            points=pts
-                        )
-                    )
-                    
-                    # Track the point IDs that have been migrated
-                    migrated_point_ids.extend([point.id for point in points])
-                    migrated_count += len(points)
+                    await queue.put(points)
 
                     # Break if no more pages
                     if next_offset is None:
                         break
+            except Exception as e:
+                # Hand scroll failures to the consumer so they surface to the caller
+                await queue.put(e)
+                return
+
+            # Sentinel tells the consumer the source is exhausted
+            await queue.put(None)
+
+        async def consumer() -> int:
+            copied = 0
+            while True:
+                points = await queue.get()
+                if points is None:
+                    return copied
+                if isinstance(points, Exception):
+                    raise points
+
+                # Re-upload points to target collection, split to respect upsert size limits
+                for start in range(0, len(points), upsert_batch_size):
+                    chunk = [
+                        PointStruct(id=point.id, vector=point.vector, payload=point.payload)
+                        for point in points[start:start + upsert_batch_size]
+                    ]
+                    await self.qdrant.upsert(target_collection, chunk)
+
+                if delete_source:
+                    await self._delete_migrated_points(source_collection, target_collection, points)
+
+                copied += len(points)
+                if progress is not None:
+                    await progress.put((target_collection, len(points)))
+
+        producer_task = asyncio.create_task(producer())
+        try:
+            return await consumer()
+        finally:
+            # No-op once the producer has finished; stops scrolling if the upload side failed,
+            # and waits for it so nothing outlives this shard
+            producer_task.cancel()
+            await asyncio.gather(producer_task, return_exceptions=True)
+
+    async def _delete_migrated_points(self, source_collection: str, target_collection: str, points) -> None:
+        """
+        Delete a migrated batch from the source after confirming it landed in the target.
 
-            # Perform validation to ensure migration was successful
-            # Count total expected points in source collections
-            total_source_points = 0
-            if await self._collection_exists(source_episodic):
-                source_episodic_count = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.count(collection_name=source_episodic)
-                )
-                total_source_points += source_episodic_count.count
-            
-            if await self._collection_exists(source_semantic):
-                source_semantic_count = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.count(collection_name=source_semantic)
-                )
-                total_source_points += source_semantic_count.count
-
-            # Count total points in target collections
-            total_target_points = 0
-            if await self._collection_exists(target_episodic):
-                target_episodic_count = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.count(collection_name=target_episodic)
-                )
-                total_target_points += target_episodic_count.count
-            
-            if await self._collection_exists(target_semantic):
-                target_semantic_count = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.count(collection_name=target_semantic)
-                )
-                total_target_points += target_semantic_count.count
+        Args:
+            source_collection: Collection the batch was read from
+            target_collection: Collection the batch was upserted into
+            points: The migrated points
 
-            self.logger.info(f"Migrated {migrated_count} memories from {source_user_id} to {target_user_id}")
-            self.logger.info(f"Source collection count: {total_source_points}, Target collection count: {total_target_points}")
+        Raises:
+            MemoryManagerError: If any point in the batch is missing from the target
+        """
+        point_ids = [point.id for point in points]
+        stored = await self.qdrant.retrieve(
+            collection_name=target_collection,
+            ids=point_ids,
+            with_payload=False,
+            with_vectors=False
+        )
+        if len(stored) != len(point_ids):
+            raise MemoryManagerError(
+                message=(
+                    f"Only {len(stored)} of {len(point_ids)} migrated points found in "
+                    f"{target_collection}; leaving them in {source_collection}"
+                ),
+                operation="migrate_memories"
+            )
 
-            return migrated_count
-        except Exception as e:
-            self.logger.error(f"Failed to migrate memories from {source_user_id} to {target_user_id}: {e}")
-            # Note: In a real implementation, you might want to implement rollback here
-            # For now, return 0 to indicate failure
-            raise
+        await self.qdrant.delete(
+            collection_name=source_collection,
+            points_selector=PointIdsList(points=point_ids)
+        )
 
     async def health_check(self) -> bool:
         """
@@ -924,10 +1312,7 @@ class MemoryManager:
         try:
             # Check Qdrant connection
             try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.qdrant.get_collections()
-                )
+                await self.qdrant.get_collections()
             except Exception as e:
                 self.logger.exception("Qdrant health check failed")
                 return False
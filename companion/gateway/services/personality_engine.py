@@ -6,38 +6,238 @@ handling PAD emotional state updates and nightly baseline drift calculations.
 """
 
 import asyncio
-import json
 import logging
-from typing import Optional, Dict, Any
+import time
+import orjson
+from contextlib import aclosing
+from typing import Optional, Dict, Any, Tuple, NamedTuple, AsyncIterator
 from datetime import datetime, timedelta
-from ..models.personality import BigFiveTraits, PADState, Quirk, PsychologicalNeed, PersonalitySnapshot
+from pydantic import TypeAdapter
+from ..models.personality import (
+    BigFiveTraits, PADState, Quirk, PsychologicalNeed, PersonalitySnapshot, PADHistoryBucket,
+    EMOTION_OCTANTS
+)
 from ..models.interaction import EmotionalImpact
 from ..database import DatabaseManager
 from ..utils.exceptions import PersonalityEngineError, UserNotFoundError
 
 
+# Validators for the quirk and need arrays aggregated by the snapshot query
+QUIRK_LIST_ADAPTER = TypeAdapter(list[Quirk])
+NEED_LIST_ADAPTER = TypeAdapter(list[PsychologicalNeed])
+PAD_ADAPTER = TypeAdapter(PADState)
+PAD_LIST_ADAPTER = TypeAdapter(list[PADState])
+
+# Baseline written for new personalities and used when a row has no pad_baseline
+NEUTRAL_PAD_BASELINE = {"pleasure": 0.0, "arousal": 0.0, "dominance": 0.0}
+
+# How long a cached personality snapshot is served before re-reading it
+SNAPSHOT_CACHE_TTL_SECONDS = 30.0
+
+# Maximum number of users whose snapshots are kept in the cache
+SNAPSHOT_CACHE_MAX_USERS = 1024
+
+# How long cached Big Five traits are served; they are fixed after creation
+BIG_FIVE_CACHE_TTL_SECONDS = 60.0
+
+# Maximum number of users whose Big Five traits are kept in the cache
+BIG_FIVE_CACHE_MAX_USERS = 50_000
+
+# Default quirks for a new user: (name, category, description, strength, confidence)
+DEFAULT_QUIRK_ROWS: Tuple[Tuple[str, str, str, float, float], ...] = (
+    ("curious_questioner", "behavior", "Frequently asks follow-up questions to learn more", 0.1, 0.1),
+    ("empathetic_responder", "speech_pattern", "Often responds with empathy and emotional understanding", 0.1, 0.1),
+)
+
+# Default needs for a new user: (need_type, current_level, baseline_level, decay_rate)
+DEFAULT_NEED_ROWS: Tuple[Tuple[str, float, float, float], ...] = (
+    ("social", 0.5, 0.5, 0.03),
+    ("intellectual", 0.5, 0.5, 0.02),
+    ("creative", 0.5, 0.5, 0.015),
+    ("rest", 0.5, 0.5, 0.04),
+    ("validation", 0.5, 0.5, 0.025),
+)
+
+# Default number of history snapshots returned; callers rarely chart more points
+DEFAULT_HISTORY_LIMIT = 100
+
+# date_trunc units accepted for bucketed PAD history
+PAD_HISTORY_BUCKETS = {"hour", "day", "week"}
+
+# Columns of a complete personality snapshot, selected from personality_state
+# aliased as ps: traits, PAD state and baseline plus the user's active quirks and
+# needs aggregated into JSON arrays
+SNAPSHOT_COLUMNS = """
+    ps.openness, ps.conscientiousness, ps.extraversion, ps.agreeableness,
+    ps.neuroticism, ps.pleasure, ps.arousal, ps.dominance, ps.emotion_label,
+    ps.pad_baseline,
+    (SELECT jsonb_agg(jsonb_build_object(
+                'id', q.id::text, 'user_id', q.user_id, 'name', q.name,
+                'category', q.category, 'description', q.description,
+                'strength', q.strength, 'confidence', q.confidence))
+     FROM quirks q
+     WHERE q.user_id = ps.user_id AND q.is_active = TRUE) AS quirks,
+    (SELECT jsonb_agg(jsonb_build_object(
+                'need_type', n.need_type, 'current_level', n.current_level,
+                'baseline_level', n.baseline_level, 'decay_rate', n.decay_rate,
+                'trigger_threshold', n.trigger_threshold,
+                'satisfaction_rate', n.satisfaction_rate))
+     FROM needs n
+     WHERE n.user_id = ps.user_id) AS needs
+"""
+
+# Window precomputed by the personality_pad_stats materialized view (migration 007)
+PAD_STATS_WINDOW_DAYS = 14
+
+# Oldest personality_pad_stats refresh still served; the scheduler refreshes every
+# 5 minutes, so anything older means refreshes are failing
+PAD_STATS_MAX_AGE_SECONDS = 600
+
+# Rows fetched per round-trip when streaming a user's quirks
+QUIRK_CURSOR_PREFETCH = 256
+
+# Minimum interactions in the drift window before the PAD baseline moves
+MIN_DRIFT_INTERACTIONS = 5
+
+# Attempts at a PAD update that lost the race for the user's current state row
+PAD_UPDATE_MAX_ATTEMPTS = 3
+
+# Emotion labels indexed by PAD octant, passed to SQL as a text[]
+EMOTION_OCTANT_LABELS = list(EMOTION_OCTANTS)
+
+
+def _parse_json_list(adapter: TypeAdapter, value: Any) -> list:
+    """
+    Validate a jsonb_agg column (NULL when the aggregate matched no rows). The
+    pool decodes JSONB to a list; JSON text is still accepted.
+
+    Args:
+        adapter: TypeAdapter for the target list type
+        value: Raw column value
+
+    Returns:
+        Validated list, empty when the column is NULL
+    """
+    if value is None:
+        return []
+    if isinstance(value, (str, bytes)):
+        return adapter.validate_json(value)
+    return adapter.validate_python(value)
+
+
+def _decode_pad_baseline(value: Any) -> Dict[str, Any]:
+    """
+    Decode a pad_baseline column without validating it. The pool decodes JSONB
+    to a dict; JSON text is still accepted for connections without the codec.
+
+    Args:
+        value: Raw column value (dict, JSON text or NULL)
+
+    Returns:
+        Baseline as a dict, neutral when the column is empty
+    """
+    if isinstance(value, (str, bytes)):
+        value = orjson.loads(value)
+    return value or NEUTRAL_PAD_BASELINE
+
+
+def _parse_pad_baseline(value: Any) -> PADState:
+    """
+    Validate a pad_baseline column.
+
+    Args:
+        value: Raw column value (dict, JSON text or NULL)
+
+    Returns:
+        Baseline PAD state, neutral when the column is empty
+    """
+    return PAD_ADAPTER.validate_python(_decode_pad_baseline(value))
+
+
+def _snapshot_from_row(user_id: str, row) -> PersonalitySnapshot:
+    """
+    Build a personality snapshot from a row selected with SNAPSHOT_COLUMNS.
+
+    Args:
+        user_id: Discord user ID
+        row: Database record
+
+    Returns:
+        Personality snapshot
+    """
+    return PersonalitySnapshot.model_construct(
+        user_id=user_id,
+        big_five=BigFiveTraits.model_construct(
+            openness=row['openness'],
+            conscientiousness=row['conscientiousness'],
+            extraversion=row['extraversion'],
+            agreeableness=row['agreeableness'],
+            neuroticism=row['neuroticism']
+        ),
+        current_pad=PADState.model_construct(
+            pleasure=row['pleasure'],
+            arousal=row['arousal'],
+            dominance=row['dominance'],
+            emotion_label=row['emotion_label']
+        ),
+        pad_baseline=_parse_pad_baseline(row['pad_baseline']),
+        active_quirks=_parse_json_list(QUIRK_LIST_ADAPTER, row['quirks']),
+        psychological_needs=_parse_json_list(NEED_LIST_ADAPTER, row['needs'])
+    )
+
+
+class PADVariance(NamedTuple):
+    """Sample variance of each PAD dimension over a history window."""
+    pleasure: float
+    arousal: float
+    dominance: float
+    sample_count: int
+
+    @property
+    def average(self) -> float:
+        """Mean variance across the three dimensions."""
+        return (self.pleasure + self.arousal + self.dominance) / 3.0
+
+
 class PersonalityEngine:
     """
     Manages personality states including Big Five traits, PAD emotional states,
     quirks, and psychological needs with proper user scoping.
     """
     
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, *, snapshot_ttl: float = SNAPSHOT_CACHE_TTL_SECONDS):
         """
         Initialize the personality engine with database manager.
         
         Args:
             db_manager: Database manager for user-scoped queries
+            snapshot_ttl: Seconds a cached personality snapshot stays valid
         """
         self.db = db_manager
+        self.snapshot_ttl = snapshot_ttl
         self.logger = logging.getLogger(__name__)
+        # user_id -> (monotonic time fetched, snapshot), least recently used first
+        self._snapshot_cache: Dict[str, Tuple[float, PersonalitySnapshot]] = {}
+        # Per-user locks so concurrent cache misses trigger a single fetch; a lock is
+        # dropped once no caller holds or waits on it
+        self._snapshot_locks: Dict[str, asyncio.Lock] = {}
+        # user_id -> callers holding or waiting on that user's snapshot lock
+        self._snapshot_lock_users: Dict[str, int] = {}
+        # user_id -> {days: (monotonic time computed, variance)}
+        self._variance_cache: Dict[str, Dict[int, Tuple[float, PADVariance]]] = {}
+        # user_id -> (monotonic time fetched, traits), oldest entry first
+        self._big_five_cache: Dict[str, Tuple[float, BigFiveTraits]] = {}
+        # user_id -> (monotonic time fetched, active quirks), oldest entry first
+        self._active_quirks_cache: Dict[str, Tuple[float, list[Quirk]]] = {}
     
-    async def initialize_personality(self, user_id: str) -> PersonalitySnapshot:
+    async def initialize_personality(self, user_id: str, refetch: bool = False) -> PersonalitySnapshot:
         """
         Initialize a new user's personality with default Big Five traits and PAD state.
         
         Args:
             user_id: Discord user ID
+            refetch: Re-read the snapshot from the database, e.g. when the
+                server-generated quirk ids are needed (default False)
             
         Returns:
             Initial personality snapshot
@@ -46,70 +246,85 @@ class PersonalityEngine:
             PersonalityEngineError: If initialization fails
         """
         try:
-            # Create initial personality state record within a transaction
-            async with self.db.get_transaction() as tx:
-                # Generate default Big Five traits (randomized in a full implementation)
-                big_five = BigFiveTraits(
-                    openness=0.5,
-                    conscientiousness=0.5,
-                    extraversion=0.5,
-                    agreeableness=0.5,
-                    neuroticism=0.5
-                )
-                
-                # Generate default PAD state
-                initial_pad = PADState(
-                    pleasure=0.0,
-                    arousal=0.0,
-                    dominance=0.0
-                )
-                
-                # Create initial personality state record
-                query = """
+            # Generate default Big Five traits (randomized in a full implementation)
+            big_five = BigFiveTraits(
+                openness=0.5,
+                conscientiousness=0.5,
+                extraversion=0.5,
+                agreeableness=0.5,
+                neuroticism=0.5
+            )
+
+            # Generate default PAD state
+            initial_pad = PADState(
+                pleasure=0.0,
+                arousal=0.0,
+                dominance=0.0
+            )
+
+            # Create the current personality state, default quirks and default needs
+            # in a single statement; a lone statement is atomic, so no explicit
+            # transaction is needed
+            query = """
+                WITH ins AS (
                     INSERT INTO personality_state
                     (user_id, openness, conscientiousness, extraversion, agreeableness, neuroticism,
-                     pleasure, arousal, dominance, emotion_label, pad_baseline)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                     pleasure, arousal, dominance, emotion_label, pad_baseline, is_current)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, TRUE)
                     RETURNING id
-                """
-                
-                params = (
-                    user_id,
-                    big_five.openness,
-                    big_five.conscientiousness,
-                    big_five.extraversion,
-                    big_five.agreeableness,
-                    big_five.neuroticism,
-                    initial_pad.pleasure,
-                    initial_pad.arousal,
-                    initial_pad.dominance,
-                    initial_pad.to_emotion_octant(),
-                    initial_pad.model_dump_json()
+                ), q AS (
+                    INSERT INTO quirks
+                    (user_id, name, category, description, strength, confidence)
+                    SELECT $1, *
+                    FROM unnest($12::text[], $13::text[], $14::text[], $15::float8[], $16::float8[])
+                ), n AS (
+                    INSERT INTO needs
+                    (user_id, need_type, current_level, baseline_level, decay_rate)
+                    SELECT $1, *
+                    FROM unnest($17::text[], $18::float8[], $19::float8[], $20::float8[])
                 )
+                SELECT id FROM ins
+            """
 
-                row = await tx.connection.fetchrow(query, *params)
-                if row is None:
-                    raise PersonalityEngineError(
-                        message="Failed to create initial personality state",
-                        operation="initialize_personality"
-                    )
+            params = (
+                user_id,
+                big_five.openness,
+                big_five.conscientiousness,
+                big_five.extraversion,
+                big_five.agreeableness,
+                big_five.neuroticism,
+                initial_pad.pleasure,
+                initial_pad.arousal,
+                initial_pad.dominance,
+                initial_pad.to_emotion_octant(),
+                NEUTRAL_PAD_BASELINE,  # New personalities start from the neutral baseline
+                # Column-wise arrays for unnest
+                *(list(column) for column in zip(*DEFAULT_QUIRK_ROWS)),
+                *(list(column) for column in zip(*DEFAULT_NEED_ROWS)),
+            )
 
-                # Mark as current state
-                state_id = row["id"]
-                await tx.execute(
-                    "UPDATE personality_state SET is_current = TRUE WHERE id = $1",
-                    state_id
+            row = await self.db.execute_user_fetchrow(user_id, query, params)
+            self.invalidate(user_id)
+            if row is None:
+                raise PersonalityEngineError(
+                    message="Failed to create initial personality state",
+                    operation="initialize_personality"
                 )
-                
-                # Initialize default quirks
-                await self._initialize_default_quirks_tx(user_id, tx)
-                
-                # Initialize default psychological needs
-                await self._initialize_default_needs_tx(user_id, tx)
-                
-                # Commit happens automatically when exiting the transaction context
-                
-            return await self.get_personality_snapshot(user_id)
+
+            if refetch:
+                return await self.get_personality_snapshot(user_id)
+
+            # Everything in the snapshot was just written, so build it from the local values
+            return PersonalitySnapshot(
+                user_id=user_id,
+                big_five=big_five,
+                current_pad=initial_pad.model_copy(
+                    update={"emotion_label": initial_pad.to_emotion_octant()}
+                ),
+                pad_baseline=initial_pad,
+                active_quirks=self._default_quirks(user_id),
+                psychological_needs=self._default_needs()
+            )
             
         except Exception as e:
             self.logger.exception("Personality initialization failed for user %s", user_id)
@@ -118,202 +333,88 @@ class PersonalityEngine:
                 operation="initialize_personality"
             ) from e
     
-    async def _initialize_default_quirks(self, user_id: str):
+    async def initialize_personalities(self, user_ids: list[str]) -> int:
         """
-        Initialize default quirks for a new user.
-        
+        Initialize default personalities for a cohort of new users, e.g. when
+        provisioning or seeding many users at once.
+
+        Each table is filled by one statement, whatever the cohort size.
+
         Args:
-            user_id: Discord user ID
+            user_ids: Discord user IDs to initialize
+
+        Returns:
+            Number of personalities created
+
+        Raises:
+            PersonalityEngineError: If initialization fails (nothing is written)
         """
-        default_quirks = [
-            Quirk(
-                user_id=user_id,
-                name="curious_questioner",
-                category="behavior",
-                description="Frequently asks follow-up questions to learn more",
-                strength=0.1,
-                confidence=0.1
-            ),
-            Quirk(
-                user_id=user_id,
-                name="empathetic_responder",
-                category="speech_pattern",
-                description="Often responds with empathy and emotional understanding",
-                strength=0.1,
-                confidence=0.1
-            )
-        ]
-        
-        for quirk in default_quirks:
-            query = """
-                INSERT INTO quirks
-                (user_id, name, category, description, strength, confidence)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """
-            params = (
-                user_id,
-                quirk.name,
-                quirk.category,
-                quirk.description,
-                quirk.strength,
-                quirk.confidence
-            )
-            await self.db.execute_user_query(user_id, query, params)
+        if not user_ids:
+            return 0
+
+        initial_pad = PADState(pleasure=0.0, arousal=0.0, dominance=0.0)
+        state = (
+            0.5, 0.5, 0.5, 0.5, 0.5,
+            initial_pad.pleasure, initial_pad.arousal, initial_pad.dominance,
+            initial_pad.to_emotion_octant(),
+            NEUTRAL_PAD_BASELINE,  # New personalities start from the neutral baseline
+        )
+
+        try:
+            async with self.db.get_transaction() as tx:
+                await tx.insert_default_personalities(user_ids, state, DEFAULT_QUIRK_ROWS, DEFAULT_NEED_ROWS)
+
+            for user_id in user_ids:
+                self.invalidate(user_id)
 
-    async def _initialize_default_quirks_tx(self, user_id: str, tx):
+            return len(user_ids)
+
+        except Exception as e:
+            self.logger.exception("Bulk personality initialization failed for %d users", len(user_ids))
+            raise PersonalityEngineError(
+                message=f"Bulk personality initialization failed: {e!s}",
+                operation="initialize_personalities"
+            ) from e
+
+    def _default_quirks(self, user_id: str) -> list[Quirk]:
         """
-        Initialize default quirks for a new user within a transaction.
-        
+        Build the default quirks assigned to a new user.
+
         Args:
             user_id: Discord user ID
-            tx: Database transaction
+
+        Returns:
+            List of default Quirk objects
         """
-        default_quirks = [
-            Quirk(
-                user_id=user_id,
-                name="curious_questioner",
-                category="behavior",
-                description="Frequently asks follow-up questions to learn more",
-                strength=0.1,
-                confidence=0.1
-            ),
+        return [
             Quirk(
                 user_id=user_id,
-                name="empathetic_responder",
-                category="speech_pattern",
-                description="Often responds with empathy and emotional understanding",
-                strength=0.1,
-                confidence=0.1
-            )
-        ]
-        
-        for quirk in default_quirks:
-            query = """
-                INSERT INTO quirks
-                (user_id, name, category, description, strength, confidence)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            """
-            params = (
-                user_id,
-                quirk.name,
-                quirk.category,
-                quirk.description,
-                quirk.strength,
-                quirk.confidence
-            )
-            await tx.execute(query, *params)
-    
-    async def _initialize_default_needs(self, user_id: str):
-        """
-        Initialize default psychological needs for a new user.
-        
-        Args:
-            user_id: Discord user ID
-        """
-        default_needs = [
-            PsychologicalNeed(
-                need_type="social",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.03
-            ),
-            PsychologicalNeed(
-                need_type="intellectual",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.02
-            ),
-            PsychologicalNeed(
-                need_type="creative",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.015
-            ),
-            PsychologicalNeed(
-                need_type="rest",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.04
-            ),
-            PsychologicalNeed(
-                need_type="validation",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.025
+                name=name,
+                category=category,
+                description=description,
+                strength=strength,
+                confidence=confidence
             )
+            for name, category, description, strength, confidence in DEFAULT_QUIRK_ROWS
         ]
-        
-        for need in default_needs:
-            query = """
-                INSERT INTO needs
-                (user_id, need_type, current_level, baseline_level, decay_rate)
-                VALUES ($1, $2, $3, $4, $5)
-            """
-            params = (
-                user_id,
-                need.need_type,
-                need.current_level,
-                need.baseline_level,
-                need.decay_rate
-            )
-            await self.db.execute_user_query(user_id, query, params)
 
-    async def _initialize_default_needs_tx(self, user_id: str, tx):
+    def _default_needs(self) -> list[PsychologicalNeed]:
         """
-        Initialize default psychological needs for a new user within a transaction.
-        
-        Args:
-            user_id: Discord user ID
-            tx: Database transaction
+        Build the default psychological needs assigned to a new user.
+
+        Returns:
+            List of default PsychologicalNeed objects
         """
-        default_needs = [
-            PsychologicalNeed(
-                need_type="social",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.03
-            ),
-            PsychologicalNeed(
-                need_type="intellectual",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.02
-            ),
+        return [
             PsychologicalNeed(
-                need_type="creative",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.015
-            ),
-            PsychologicalNeed(
-                need_type="rest",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.04
-            ),
-            PsychologicalNeed(
-                need_type="validation",
-                current_level=0.5,
-                baseline_level=0.5,
-                decay_rate=0.025
+                need_type=need_type,
+                current_level=current_level,
+                baseline_level=baseline_level,
+                decay_rate=decay_rate
             )
+            for need_type, current_level, baseline_level, decay_rate in DEFAULT_NEED_ROWS
         ]
-        
-        for need in default_needs:
-            query = """
-                INSERT INTO needs
-                (user_id, need_type, current_level, baseline_level, decay_rate)
-                VALUES ($1, $2, $3, $4, $5)
-            """
-            params = (
-                user_id,
-                need.need_type,
-                need.current_level,
-                need.baseline_level,
-                need.decay_rate
-            )
-            await tx.execute(query, *params)
-    
+
     async def get_current_pad_state(self, user_id: str) -> Optional[PADState]:
         """
         Get the current PAD emotional state for a user.
@@ -331,25 +432,31 @@ class PersonalityEngine:
             LIMIT 1
         """
         
+        snapshot = self._get_cached_snapshot(user_id)
+        if snapshot is not None:
+            return snapshot.current_pad
+
         try:
-            result = await self.db.execute_user_query(user_id, query, (user_id,))
-            if not result:
+            row = await self.db.execute_user_fetchrow(user_id, query, (user_id,))
+            if row is None:
                 return None
             
-            row = result[0]
-            return PADState(
+            return PADState.model_construct(
                 pleasure=row['pleasure'],
                 arousal=row['arousal'],
                 dominance=row['dominance'],
                 emotion_label=row['emotion_label']
             )
         except Exception as e:
-            self.logger.error(f"Failed to get current PAD state for user {user_id}: {e}")
+            self.logger.error("Failed to get current PAD state for user %s: %s", user_id, e)
             return None
     
     async def get_personality_snapshot(self, user_id: str) -> Optional[PersonalitySnapshot]:
         """
         Get a complete personality snapshot for a user.
+
+        Snapshots are cached for ``snapshot_ttl`` seconds and invalidated by every
+        write made through this engine.
         
         Args:
             user_id: Discord user ID
@@ -357,107 +464,118 @@ class PersonalityEngine:
         Returns:
             Personality snapshot including Big Five traits, PAD state, quirks, and needs
         """
+        cached = self._get_cached_snapshot(user_id)
+        if cached is not None:
+            return cached
+
+        lock = self._snapshot_locks.get(user_id)
+        if lock is None:
+            lock = self._snapshot_locks[user_id] = asyncio.Lock()
+        self._snapshot_lock_users[user_id] = self._snapshot_lock_users.get(user_id, 0) + 1
         try:
-            # Get current personality state
-            personality_query = """
-                SELECT openness, conscientiousness, extraversion, agreeableness, neuroticism,
-                       pleasure, arousal, dominance, emotion_label, pad_baseline
-                FROM personality_state
-                WHERE user_id = $1 AND is_current = TRUE
+            async with lock:
+                # Another caller may have filled the cache while we waited
+                cached = self._get_cached_snapshot(user_id)
+                if cached is not None:
+                    return cached
+
+                snapshot = await self._fetch_personality_snapshot(user_id)
+                if snapshot is not None:
+                    self._cache_snapshot(user_id, snapshot)
+                return snapshot
+        finally:
+            # Drop the lock with its last user so the dict only holds in-flight fetches
+            remaining = self._snapshot_lock_users.pop(user_id) - 1
+            if remaining:
+                self._snapshot_lock_users[user_id] = remaining
+            else:
+                del self._snapshot_locks[user_id]
+
+    def _cache_snapshot(self, user_id: str, snapshot: PersonalitySnapshot):
+        """
+        Store a freshly read snapshot, evicting the least recently used entry
+        when full.
+
+        Args:
+            user_id: Discord user ID
+            snapshot: Snapshot to cache
+        """
+        self._snapshot_cache.pop(user_id, None)
+        self._snapshot_cache[user_id] = (time.monotonic(), snapshot)
+        if len(self._snapshot_cache) > SNAPSHOT_CACHE_MAX_USERS:
+            self._snapshot_cache.pop(next(iter(self._snapshot_cache)))
+
+    def _get_cached_snapshot(self, user_id: str) -> Optional[PersonalitySnapshot]:
+        """
+        Return the cached snapshot for a user if it is still fresh.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Cached snapshot or None if missing or expired
+        """
+        cached = self._snapshot_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.snapshot_ttl:
+            # Move to the back so eviction drops the least recently used entry
+            self._snapshot_cache[user_id] = self._snapshot_cache.pop(user_id)
+            return cached[1]
+        return None
+
+    def invalidate(self, user_id: str):
+        """
+        Drop every cached personality read for a user.
+
+        Writes made through this engine invalidate automatically; call this after
+        changing a user's personality, quirks or needs through other code paths.
+
+        Args:
+            user_id: Discord user ID
+        """
+        self._invalidate_snapshot(user_id)
+        self._big_five_cache.pop(user_id, None)
+
+    def _invalidate_snapshot(self, user_id: str):
+        """
+        Drop the cached snapshot, PAD variances and active quirks for a user
+        after a write.
+
+        Args:
+            user_id: Discord user ID
+        """
+        self._snapshot_cache.pop(user_id, None)
+        self._variance_cache.pop(user_id, None)
+        self._active_quirks_cache.pop(user_id, None)
+
+    async def _fetch_personality_snapshot(self, user_id: str) -> Optional[PersonalitySnapshot]:
+        """
+        Read a complete personality snapshot for a user from the database.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Personality snapshot or None if not found or on error
+        """
+        try:
+            # Fetch the current personality state together with its active quirks
+            # and needs, aggregated into JSON arrays, in a single round-trip
+            personality_query = f"""
+                SELECT {SNAPSHOT_COLUMNS}
+                FROM personality_state ps
+                WHERE ps.user_id = $1 AND ps.is_current = TRUE
                 LIMIT 1
             """
             
-            personality_result = await self.db.execute_user_query(
-                user_id, personality_query, (user_id,)
-            )
+            row = await self.db.execute_user_fetchrow(user_id, personality_query, (user_id,))
             
-            if not personality_result:
+            if row is None:
                 return None
             
-            row = personality_result[0]
-            
-            # Get active quirks
-            quirks_query = """
-                SELECT id, name, category, description, strength, confidence
-                FROM quirks
-                WHERE user_id = $1 AND is_active = TRUE
-            """
-            
-            quirks_result = await self.db.execute_user_query(
-                user_id, quirks_query, (user_id,)
-            )
-            
-            active_quirks = [
-                Quirk(
-                    id=str(quirk_row['id']),
-                    user_id=user_id,
-                    name=quirk_row['name'],
-                    category=quirk_row['category'],
-                    description=quirk_row['description'],
-                    strength=quirk_row['strength'],
-                    confidence=quirk_row['confidence']
-                )
-                for quirk_row in quirks_result
-            ]
-            
-            # Get psychological needs
-            needs_query = """
-                SELECT need_type, current_level, baseline_level, decay_rate,
-                       trigger_threshold, satisfaction_rate
-                FROM needs
-                WHERE user_id = $1
-            """
-
-            needs_result = await self.db.execute_user_query(
-                user_id, needs_query, (user_id,)
-            )
-
-            psychological_needs = [
-                PsychologicalNeed(
-                    need_type=need_row['need_type'],
-                    current_level=need_row['current_level'],
-                    baseline_level=need_row['baseline_level'],
-                    decay_rate=need_row['decay_rate'],
-                    trigger_threshold=need_row['trigger_threshold'],
-                    satisfaction_rate=need_row['satisfaction_rate']
-                )
-                for need_row in needs_result
-            ]
-            
-            # Parse pad_baseline from database (stored as JSON)
-            pad_baseline_data = row['pad_baseline']
-            if isinstance(pad_baseline_data, str):
-                pad_baseline_dict = json.loads(pad_baseline_data)
-            elif isinstance(pad_baseline_data, dict):
-                pad_baseline_dict = pad_baseline_data
-            else:
-                # Fallback to neutral baseline
-                pad_baseline_dict = {"pleasure": 0.0, "arousal": 0.0, "dominance": 0.0}
-
-            pad_baseline = PADState(**pad_baseline_dict)
-
-            return PersonalitySnapshot(
-                user_id=user_id,
-                big_five=BigFiveTraits(
-                    openness=row['openness'],
-                    conscientiousness=row['conscientiousness'],
-                    extraversion=row['extraversion'],
-                    agreeableness=row['agreeableness'],
-                    neuroticism=row['neuroticism']
-                ),
-                current_pad=PADState(
-                    pleasure=row['pleasure'],
-                    arousal=row['arousal'],
-                    dominance=row['dominance'],
-                    emotion_label=row['emotion_label']
-                ),
-                pad_baseline=pad_baseline,
-                active_quirks=active_quirks,
-                psychological_needs=psychological_needs
-            )
+            return _snapshot_from_row(user_id, row)
             
         except Exception as e:
-            self.logger.error(f"Failed to get personality snapshot for user {user_id}: {e}")
+            self.logger.error("Failed to get personality snapshot for user %s: %s", user_id, e)
             return None
     
     async def update_pad_state(self, user_id: str, delta: PADState) -> PADState:
@@ -476,82 +594,70 @@ class PersonalityEngine:
             UserNotFoundError: If user personality state not found
         """
         try:
-            # Get current personality snapshot (includes Big Five traits and PAD baseline)
-            current_snapshot = await self.get_personality_snapshot(user_id)
-            if not current_snapshot:
-                raise UserNotFoundError(user_id=user_id, message="Personality state not found")
-
-            # Apply delta with clamping
-            new_pleasure = max(-1.0, min(1.0, current_snapshot.current_pad.pleasure + delta.pleasure))
-            new_arousal = max(-1.0, min(1.0, current_snapshot.current_pad.arousal + delta.arousal))
-            new_dominance = max(-1.0, min(1.0, current_snapshot.current_pad.dominance + delta.dominance))
-
-            # Create new PAD state
-            new_pad_state = PADState(
-                pleasure=new_pleasure,
-                arousal=new_arousal,
-                dominance=new_dominance
-            )
-
-            # Archive current state
-            archive_query = """
-                UPDATE personality_state
-                SET is_current = FALSE
-                WHERE user_id = $1 AND is_current = TRUE
-            """
-            await self.db.execute_user_query(user_id, archive_query, (user_id,))
-
-            # Insert new state (preserving Big Five traits and PAD baseline)
-            insert_query = """
+            # Archive the current state and insert its successor in one statement.
+            # Big Five traits and the PAD baseline are copied from the archived row;
+            # the delta is applied and clamped server-side, and the emotion label is
+            # looked up from the octant index (4*P + 2*A + D, signs as bits).
+            query = """
+                WITH arch AS (
+                    UPDATE personality_state
+                    SET is_current = FALSE
+                    WHERE user_id = $1 AND is_current = TRUE
+                    RETURNING openness, conscientiousness, extraversion, agreeableness, neuroticism,
+                              pad_baseline,
+                              GREATEST(-1.0, LEAST(1.0, pleasure + $2)) AS new_pleasure,
+                              GREATEST(-1.0, LEAST(1.0, arousal + $3)) AS new_arousal,
+                              GREATEST(-1.0, LEAST(1.0, dominance + $4)) AS new_dominance
+                )
                 INSERT INTO personality_state
                 (user_id, openness, conscientiousness, extraversion, agreeableness, neuroticism,
                  pleasure, arousal, dominance, emotion_label, pad_baseline, is_current)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, TRUE)
-                RETURNING id
+                SELECT $1, openness, conscientiousness, extraversion, agreeableness, neuroticism,
+                       new_pleasure, new_arousal, new_dominance,
+                       ($5::text[])[(new_pleasure > 0)::int * 4 + (new_arousal > 0)::int * 2
+                                    + (new_dominance > 0)::int + 1],
+                       pad_baseline, TRUE
+                FROM arch
+                RETURNING pleasure, arousal, dominance, emotion_label
             """
 
-            # Normalize pad_baseline to JSON string
-            if isinstance(current_snapshot.pad_baseline, PADState):
-                pad_baseline_json = current_snapshot.pad_baseline.model_dump_json()
-            elif isinstance(current_snapshot.pad_baseline, dict):
-                pad_baseline_json = PADState(**current_snapshot.pad_baseline).model_dump_json()
-            elif isinstance(current_snapshot.pad_baseline, str):
-                pad_baseline_json = current_snapshot.pad_baseline
+            params = (user_id, delta.pleasure, delta.arousal, delta.dominance, EMOTION_OCTANT_LABELS)
+
+            for _ in range(PAD_UPDATE_MAX_ATTEMPTS):
+                result = await self.db.execute_user_query(user_id, query, params)
+                self._invalidate_snapshot(user_id)
+                if result:
+                    break
+
+                # No current row matched. Either the user has no personality state, or a
+                # concurrent update archived the row this statement waited on and its
+                # successor was not yet visible; a fresh statement will see it.
+                has_state = await self.db.execute_user_fetchval(
+                    user_id,
+                    "SELECT EXISTS(SELECT 1 FROM personality_state WHERE user_id = $1)",
+                    (user_id,)
+                )
+                if not has_state:
+                    raise UserNotFoundError(user_id=user_id, message="Personality state not found")
             else:
-                # Fallback: create baseline from current PAD state
-                pad_baseline_json = PADState(
-                    pleasure=current_snapshot.current_pad.pleasure,
-                    arousal=current_snapshot.current_pad.arousal,
-                    dominance=current_snapshot.current_pad.dominance
-                ).model_dump_json()
-
-            insert_params = (
-                user_id,
-                current_snapshot.big_five.openness,
-                current_snapshot.big_five.conscientiousness,
-                current_snapshot.big_five.extraversion,
-                current_snapshot.big_five.agreeableness,
-                current_snapshot.big_five.neuroticism,
-                new_pad_state.pleasure,
-                new_pad_state.arousal,
-                new_pad_state.dominance,
-                new_pad_state.to_emotion_octant(),
-                pad_baseline_json,
-            )
-            
-            result = await self.db.execute_user_query(user_id, insert_query, insert_params)
-            if not result:
                 raise PersonalityEngineError(
-                    message="Failed to update personality state",
+                    message=f"PAD state update kept losing to concurrent updates "
+                            f"after {PAD_UPDATE_MAX_ATTEMPTS} attempts",
                     operation="update_pad_state"
                 )
-            
-            return new_pad_state
+
+            row = result[0]
+            return PADState(
+                pleasure=row['pleasure'],
+                arousal=row['arousal'],
+                dominance=row['dominance'],
+                emotion_label=row['emotion_label']
+            )
             
         except UserNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"PAD state update failed for user {user_id}: {e}")
+            self.logger.error("PAD state update failed for user %s: %s", user_id, e)
             raise PersonalityEngineError(
                 message=f"PAD state update failed: {str(e)}",
                 operation="update_pad_state"
@@ -582,72 +688,148 @@ class PersonalityEngine:
             # Access baseline from the top-level field, not from current_pad
             current_baseline = current_personality.pad_baseline
             if not current_baseline:
-                self.logger.warning(f"No baseline PAD state found for user {user_id}, skipping drift")
+                self.logger.warning("No baseline PAD state found for user %s, skipping drift", user_id)
                 return current_personality.current_pad
             
-            # Get all user interactions from last 7 days
-            interactions_query = """
-                SELECT pad_after
-                FROM interactions
-                WHERE user_id = $1 AND timestamp >= NOW() - INTERVAL '7 days'
+            # Average the last 7 days of interaction PAD states and apply the drift
+            # formula server-side; the baseline is only written when there are
+            # enough interactions
+            drift_query = """
+                WITH stats AS (
+                    SELECT AVG((pad_after->>'pleasure')::float8) AS avg_pleasure,
+                           AVG((pad_after->>'arousal')::float8) AS avg_arousal,
+                           AVG((pad_after->>'dominance')::float8) AS avg_dominance,
+                           COUNT(*) AS interaction_count
+                    FROM interactions
+                    WHERE user_id = $1 AND timestamp >= NOW() - INTERVAL '7 days'
+                      AND pad_after IS NOT NULL
+                ), upd AS (
+                    UPDATE personality_state
+                    SET pad_baseline = jsonb_build_object(
+                        'pleasure', GREATEST(-1.0, LEAST(1.0, $2 + (COALESCE(stats.avg_pleasure, $2) - $2) * $5)),
+                        'arousal', GREATEST(-1.0, LEAST(1.0, $3 + (COALESCE(stats.avg_arousal, $3) - $3) * $5)),
+                        'dominance', GREATEST(-1.0, LEAST(1.0, $4 + (COALESCE(stats.avg_dominance, $4) - $4) * $5))
+                    )
+                    FROM stats
+                    WHERE personality_state.user_id = $1 AND personality_state.is_current = TRUE
+                      AND stats.interaction_count >= $6
+                    RETURNING personality_state.pad_baseline
+                )
+                SELECT stats.interaction_count, upd.pad_baseline
+                FROM stats LEFT JOIN upd ON TRUE
             """
-            
-            interactions_result = await self.db.execute_user_query(
-                user_id, interactions_query, (user_id,)
+
+            drift_params = (
+                user_id,
+                float(current_baseline.pleasure),
+                float(current_baseline.arousal),
+                float(current_baseline.dominance),
+                float(drift_rate),
+                MIN_DRIFT_INTERACTIONS,
             )
-            
-            if len(interactions_result) < 5:  # Need minimum data
+
+            drift_result = await self.db.execute_user_query(user_id, drift_query, drift_params)
+            self._invalidate_snapshot(user_id)
+
+            if not drift_result or drift_result[0]['pad_baseline'] is None:  # Need minimum data
                 return current_baseline
-            
-            # Calculate average PAD state from interactions
-            total_pleasure = sum(row['pad_after']['pleasure'] for row in interactions_result)
-            total_arousal = sum(row['pad_after']['arousal'] for row in interactions_result)
-            total_dominance = sum(row['pad_after']['dominance'] for row in interactions_result)
-            
-            count = len(interactions_result)
-            average_interaction_pad = PADState(
-                pleasure=total_pleasure / count,
-                arousal=total_arousal / count,
-                dominance=total_dominance / count
-            )
-            
-            # Apply drift formula
-            new_baseline = PADState(
-                pleasure=current_baseline.pleasure + (average_interaction_pad.pleasure - current_baseline.pleasure) * drift_rate,
-                arousal=current_baseline.arousal + (average_interaction_pad.arousal - current_baseline.arousal) * drift_rate,
-                dominance=current_baseline.dominance + (average_interaction_pad.dominance - current_baseline.dominance) * drift_rate
-            )
-            
-            # Clamp to valid ranges (-1.0 to 1.0)
-            new_baseline.pleasure = max(-1.0, min(1.0, new_baseline.pleasure))
-            new_baseline.arousal = max(-1.0, min(1.0, new_baseline.arousal))
-            new_baseline.dominance = max(-1.0, min(1.0, new_baseline.dominance))
-            
-            # Update personality state with new baseline
-            update_query = """
-                UPDATE personality_state
-                SET pad_baseline = $1
-                WHERE user_id = $2 AND is_current = TRUE
-            """
-            
-            update_params = (
-                new_baseline.model_dump_json(),
-                user_id
-            )
-            
-            await self.db.execute_user_query(user_id, update_query, update_params)
+
+            new_baseline = _parse_pad_baseline(drift_result[0]['pad_baseline'])
             
             return new_baseline
             
         except UserNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"PAD baseline drift failed for user {user_id}: {e}")
+            self.logger.error("PAD baseline drift failed for user %s: %s", user_id, e)
             raise PersonalityEngineError(
                 message=f"PAD baseline drift failed: {str(e)}",
                 operation="apply_pad_baseline_drift"
             )
     
+    async def apply_pad_baseline_drift_batch(
+        self, user_ids: Optional[list[str]] = None, drift_rate: float = 0.01
+    ) -> Dict[str, Tuple[PADState, PADState]]:
+        """
+        Apply nightly PAD baseline drift to many users in one statement.
+
+        Uses the same formula and minimum-interaction gate as
+        apply_pad_baseline_drift, with the 7-day averages grouped by user.
+
+        Args:
+            user_ids: Discord user IDs, or None for every user with enough
+                recent interactions
+            drift_rate: Maximum change rate per day (default 0.01 = 1%)
+
+        Returns:
+            Mapping of user ID to (old baseline, new baseline) for every user
+            that drifted
+
+        Raises:
+            PersonalityEngineError: If the batch update fails
+        """
+        if user_ids is not None and not user_ids:
+            return {}
+
+        try:
+            drift_query = """
+                WITH stats AS (
+                    SELECT user_id,
+                           AVG((pad_after->>'pleasure')::float8) AS avg_pleasure,
+                           AVG((pad_after->>'arousal')::float8) AS avg_arousal,
+                           AVG((pad_after->>'dominance')::float8) AS avg_dominance
+                    FROM interactions
+                    WHERE ($1::text[] IS NULL OR user_id = ANY($1::text[]))
+                      AND timestamp >= NOW() - INTERVAL '7 days'
+                      AND pad_after IS NOT NULL
+                    GROUP BY user_id
+                    HAVING COUNT(*) >= $3
+                ), cur AS (
+                    SELECT ps.id, stats.*,
+                           ps.pad_baseline AS old_baseline,
+                           (ps.pad_baseline->>'pleasure')::float8 AS pleasure,
+                           (ps.pad_baseline->>'arousal')::float8 AS arousal,
+                           (ps.pad_baseline->>'dominance')::float8 AS dominance
+                    FROM personality_state ps
+                    JOIN stats ON stats.user_id = ps.user_id
+                    WHERE ps.is_current = TRUE AND ps.pad_baseline IS NOT NULL
+                )
+                UPDATE personality_state ps
+                SET pad_baseline = jsonb_build_object(
+                    'pleasure', GREATEST(-1.0, LEAST(1.0, cur.pleasure + (cur.avg_pleasure - cur.pleasure) * $2)),
+                    'arousal', GREATEST(-1.0, LEAST(1.0, cur.arousal + (cur.avg_arousal - cur.arousal) * $2)),
+                    'dominance', GREATEST(-1.0, LEAST(1.0, cur.dominance + (cur.avg_dominance - cur.dominance) * $2))
+                )
+                FROM cur
+                WHERE ps.id = cur.id
+                RETURNING ps.user_id, cur.old_baseline, ps.pad_baseline
+            """
+
+            rows = await self.db.execute_admin_query(
+                drift_query,
+                (
+                    list(user_ids) if user_ids is not None else None,
+                    float(drift_rate),
+                    MIN_DRIFT_INTERACTIONS,
+                )
+            )
+
+            drifted = {}
+            for user_id, old_baseline, new_baseline in rows or []:
+                self._invalidate_snapshot(user_id)
+                drifted[user_id] = (
+                    _parse_pad_baseline(old_baseline),
+                    _parse_pad_baseline(new_baseline),
+                )
+            return drifted
+
+        except Exception as e:
+            self.logger.error("Batch PAD baseline drift failed: %s", e)
+            raise PersonalityEngineError(
+                message=f"Batch PAD baseline drift failed: {e!s}",
+                operation="apply_pad_baseline_drift_batch"
+            ) from e
+
     async def update_quirk_strength(self, user_id: str, quirk_name: str, strength_delta: float) -> bool:
         """
         Update the strength of a specific quirk.
@@ -660,36 +842,54 @@ class PersonalityEngine:
         Returns:
             True if update successful, False otherwise
         """
-        try:
-            # Get current quirk strength
-            query = """
-                SELECT strength FROM quirks
-                WHERE user_id = $1 AND name = $2 AND is_active = TRUE
-                LIMIT 1
-            """
-            
-            result = await self.db.execute_user_query(user_id, query, (user_id, quirk_name))
-            if not result:
-                return False
-            
-            current_strength = result[0]['strength']
-            new_strength = max(0.0, min(1.0, current_strength + strength_delta))
+        updated = await self.update_quirk_strengths(user_id, [(quirk_name, strength_delta)])
+        return quirk_name in updated
+
+    async def update_quirk_strengths(
+        self,
+        user_id: str,
+        deltas: list[Tuple[str, float]]
+    ) -> Dict[str, float]:
+        """
+        Update the strength of several active quirks in a single statement.
+        
+        Args:
+            user_id: Discord user ID
+            deltas: (quirk name, strength change) pairs
             
-            # Update quirk strength
+        Returns:
+            New strength per updated quirk name; quirks that are missing or
+            inactive are omitted. Empty on failure.
+        """
+        if not deltas:
+            return {}
+
+        try:
+            # Apply and clamp every delta server-side, no read-modify-write round-trip
             update_query = """
                 UPDATE quirks
-                SET strength = $1, last_reinforced = NOW()
-                WHERE user_id = $2 AND name = $3
+                SET strength = GREATEST(0.0, LEAST(1.0, quirks.strength + v.delta)),
+                    last_reinforced = NOW()
+                FROM unnest($2::text[], $3::float8[]) AS v(name, delta)
+                WHERE quirks.user_id = $1 AND quirks.name = v.name AND quirks.is_active = TRUE
+                RETURNING quirks.name, quirks.strength
             """
             
-            update_params = (new_strength, user_id, quirk_name)
-            await self.db.execute_user_query(user_id, update_query, update_params)
+            # UPDATE ... FROM applies only one matching source row, so merge repeats first
+            merged: Dict[str, float] = {}
+            for name, delta in deltas:
+                merged[name] = merged.get(name, 0.0) + delta
+
+            rows = await self.db.execute_user_query(
+                user_id, update_query, (user_id, list(merged), list(merged.values()))
+            )
+            self._invalidate_snapshot(user_id)
             
-            return True
+            return {row['name']: row['strength'] for row in rows}
             
         except Exception as e:
-            self.logger.error(f"Failed to update quirk strength for user {user_id}, quirk {quirk_name}: {e}")
-            return False
+            self.logger.error("Failed to update quirk strengths for user %s: %s", user_id, e)
+            return {}
     
     async def update_need_level(self, user_id: str, need_type: str, level_delta: float) -> bool:
         """
@@ -701,7 +901,7 @@ class PersonalityEngine:
             level_delta: Change in need level
             
         Returns:
-            True if update successful, False otherwise
+            True if the need was updated, False if it does not exist or on failure
         """
         try:
             update_query = """
@@ -709,90 +909,200 @@ class PersonalityEngine:
                 SET current_level = GREATEST(0.0, LEAST(1.0, current_level + $1)),
                     last_updated = NOW()
                 WHERE user_id = $2 AND need_type = $3
+                RETURNING current_level
             """
             
             update_params = (level_delta, user_id, need_type)
-            await self.db.execute_user_query(user_id, update_query, update_params)
+            rows = await self.db.execute_user_query(user_id, update_query, update_params)
+            self._invalidate_snapshot(user_id)
             
-            return True
+            return bool(rows)
             
         except Exception as e:
-            self.logger.error(f"Failed to update need level for user {user_id}, need {need_type}: {e}")
+            self.logger.error("Failed to update need level for user %s, need %s: %s", user_id, need_type, e)
             return False
-    async def get_personality_history(self, user_id: str, days: int = 30) -> list[PersonalitySnapshot]:
+
+    async def decay_needs(self, user_ids: Optional[list[str]] = None, hours: float = 1.0) -> int:
+        """
+        Apply time-based decay to psychological needs in one statement.
+
+        Each need drops by its own decay_rate per hour, clamped to [0, 1].
+
+        Args:
+            user_ids: Discord user IDs, or None for every active user
+            hours: Hours of decay to apply (default 1, matching the hourly job)
+
+        Returns:
+            Number of needs updated
+
+        Raises:
+            PersonalityEngineError: If the update fails
+        """
+        try:
+            decay_query = """
+                UPDATE needs
+                SET current_level = GREATEST(0.0, LEAST(1.0, current_level - decay_rate * $2)),
+                    last_updated = NOW()
+                WHERE ($1::text[] IS NULL OR user_id = ANY($1::text[]))
+                  -- Unscoped runs leave inactive and deleted users' needs alone
+                  AND ($1::text[] IS NOT NULL
+                       OR user_id IN (SELECT user_id FROM user_profiles WHERE status = 'active'))
+                RETURNING user_id
+            """
+
+            rows = await self.db.execute_admin_query(
+                decay_query, (list(user_ids) if user_ids is not None else None, float(hours))
+            )
+
+            for user_id in {row['user_id'] for row in rows or []}:
+                self._invalidate_snapshot(user_id)
+            return len(rows or [])
+
+        except Exception as e:
+            self.logger.error("Needs decay failed: %s", e)
+            raise PersonalityEngineError(
+                message=f"Needs decay failed: {e!s}",
+                operation="decay_needs"
+            ) from e
+
+    async def get_personality_history(
+        self,
+        user_id: str,
+        days: int = 30,
+        limit: Optional[int] = DEFAULT_HISTORY_LIMIT
+    ) -> list[PersonalitySnapshot]:
         """
         Get historical personality snapshots for a user.
 
         Args:
             user_id: Discord user ID
             days: Number of days of history to retrieve (default 30)
+            limit: Maximum number of snapshots to return (default 100, None for all)
 
         Returns:
             List of PersonalitySnapshot objects ordered by most recent first
         """
         try:
+            # LIMIT NULL returns every row
             query = """
                 SELECT id, user_id, openness, conscientiousness, extraversion, agreeableness, neuroticism,
-                       pleasure, arousal, dominance, emotion_label, pad_baseline, is_current, created_at
+                       pleasure, arousal, dominance, emotion_label, pad_baseline, is_current, timestamp
                 FROM personality_state
-                WHERE user_id = $1 AND created_at >= NOW() - make_interval(days => $2)
-                ORDER BY created_at DESC
+                WHERE user_id = $1 AND timestamp >= NOW() - make_interval(days => $2)
+                ORDER BY timestamp DESC
+                LIMIT $3
             """
 
-            rows = await self.db.execute_user_query(user_id, query, (user_id, days))
+            rows = await self.db.execute_user_query(user_id, query, (user_id, days, limit))
 
-            history = []
-            for row in rows:
-                # Parse PAD baseline
-                pad_baseline_data = row['pad_baseline']
-                if isinstance(pad_baseline_data, str):
-                    pad_baseline_dict = json.loads(pad_baseline_data)
-                elif isinstance(pad_baseline_data, dict):
-                    pad_baseline_dict = pad_baseline_data
-                else:
-                    pad_baseline_dict = {'pleasure': 0.0, 'arousal': 0.0, 'dominance': 0.0}
+            # Validate all baselines in one pass rather than one model per row
+            baselines = PAD_LIST_ADAPTER.validate_python([
+                _decode_pad_baseline(row['pad_baseline']) for row in rows
+            ])
 
-                pad_baseline = PADState(**pad_baseline_dict)
-
-                snapshot = PersonalitySnapshot(
+            history = [
+                PersonalitySnapshot.model_construct(
                     user_id=row['user_id'],
-                    big_five=BigFiveTraits(
+                    timestamp=row['timestamp'],
+                    big_five=BigFiveTraits.model_construct(
                         openness=row['openness'],
                         conscientiousness=row['conscientiousness'],
                         extraversion=row['extraversion'],
                         agreeableness=row['agreeableness'],
                         neuroticism=row['neuroticism']
                     ),
-                    current_pad=PADState(
+                    current_pad=PADState.model_construct(
                         pleasure=row['pleasure'],
                         arousal=row['arousal'],
                         dominance=row['dominance'],
-                        pad_baseline=pad_baseline
+                        emotion_label=row['emotion_label']
                     ),
+                    pad_baseline=pad_baseline,
                     active_quirks=[],  # Not including quirks in history for performance
                     psychological_needs=[]  # Not including needs in history for performance
                 )
-                history.append(snapshot)
+                for row, pad_baseline in zip(rows, baselines)
+            ]
 
             return history
 
         except Exception as e:
-            self.logger.error(f"Failed to get personality history for user {user_id}: {e}")
+            self.logger.error("Failed to get personality history for user %s: %s", user_id, e)
+            return []
+
+    async def get_pad_history_buckets(
+        self,
+        user_id: str,
+        days: int = 30,
+        bucket: str = "hour"
+    ) -> list[PADHistoryBucket]:
+        """
+        Get PAD history averaged into time buckets, one row per bucket.
+
+        Args:
+            user_id: Discord user ID
+            days: Number of days of history to cover (default 30)
+            bucket: Bucket width, one of "hour", "day" or "week" (default "hour")
+
+        Returns:
+            List of PADHistoryBucket objects ordered by most recent first
+
+        Raises:
+            PersonalityEngineError: If the bucket width is not supported
+        """
+        if bucket not in PAD_HISTORY_BUCKETS:
+            raise PersonalityEngineError(
+                message=f"Unsupported history bucket '{bucket}'",
+                operation="get_pad_history_buckets"
+            )
+
+        try:
+            query = """
+                SELECT date_trunc($3, timestamp) AS bucket_start,
+                       AVG(pleasure) AS pleasure, AVG(arousal) AS arousal,
+                       AVG(dominance) AS dominance, COUNT(*) AS sample_count
+                FROM personality_state
+                WHERE user_id = $1 AND timestamp >= NOW() - make_interval(days => $2)
+                GROUP BY bucket_start
+                ORDER BY bucket_start DESC
+            """
+
+            rows = await self.db.execute_user_query(user_id, query, (user_id, days, bucket))
+
+            return [
+                PADHistoryBucket.model_construct(
+                    bucket_start=row['bucket_start'],
+                    pleasure=row['pleasure'],
+                    arousal=row['arousal'],
+                    dominance=row['dominance'],
+                    sample_count=row['sample_count']
+                )
+                for row in rows
+            ]
+
+        except Exception as e:
+            self.logger.error("Failed to get PAD history buckets for user %s: %s", user_id, e)
             return []
 
     async def get_active_quirks(self, user_id: str) -> list[Quirk]:
         """
         Get all active quirks for a user.
 
+        Results are cached for ``snapshot_ttl`` seconds and dropped on writes.
+
         Args:
             user_id: Discord user ID
 
         Returns:
             List of active Quirk objects
         """
+        cached = self._active_quirks_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < self.snapshot_ttl:
+            return list(cached[1])
+
         try:
             query = """
-                SELECT id, name, category, description, strength, confidence
+                SELECT id::text, name, category, description, strength, confidence
                 FROM quirks
                 WHERE user_id = $1 AND is_active = TRUE
                 ORDER BY strength DESC
@@ -801,24 +1111,67 @@ class PersonalityEngine:
             rows = await self.db.execute_user_query(user_id, query, (user_id,))
 
             quirks = [
-                Quirk(
-                    id=str(row['id']),
+                Quirk.model_construct(
+                    id=quirk_id,
                     user_id=user_id,
-                    name=row['name'],
-                    category=row['category'],
-                    description=row['description'],
-                    strength=row['strength'],
-                    confidence=row['confidence']
+                    name=name,
+                    category=category,
+                    description=description,
+                    strength=strength,
+                    confidence=confidence
                 )
-                for row in rows
+                # Unpack records positionally (column order of the SELECT)
+                for quirk_id, name, category, description, strength, confidence in rows
             ]
 
-            return quirks
+            self._active_quirks_cache.pop(user_id, None)
+            self._active_quirks_cache[user_id] = (time.monotonic(), quirks)
+            if len(self._active_quirks_cache) > SNAPSHOT_CACHE_MAX_USERS:
+                self._active_quirks_cache.pop(next(iter(self._active_quirks_cache)))
+            return list(quirks)
 
         except Exception as e:
-            self.logger.error(f"Failed to get active quirks for user {user_id}: {e}")
+            self.logger.error("Failed to get active quirks for user %s: %s", user_id, e)
             return []
 
+    async def iter_all_quirks(self, user_id: str) -> AsyncIterator[Quirk]:
+        """
+        Stream all quirks (active and inactive) for a user.
+
+        Rows are fetched through a server-side cursor in batches of
+        QUIRK_CURSOR_PREFETCH, so only one batch is resident at a time. The
+        cursor holds a pool connection until the stream ends, so consume it
+        promptly rather than interleaving slow work between items.
+
+        Args:
+            user_id: Discord user ID
+
+        Yields:
+            Quirk objects, active first, strongest first
+        """
+        query = """
+            SELECT id::text, name, category, description, strength, confidence
+            FROM quirks
+            WHERE user_id = $1
+            ORDER BY is_active DESC, strength DESC
+        """
+
+        # aclosing returns the cursor's connection as soon as this stream is closed
+        async with aclosing(
+            self.db.iter_user_query(user_id, query, (user_id,), prefetch=QUIRK_CURSOR_PREFETCH)
+        ) as rows:
+            # Unpack records positionally (column order of the SELECT)
+            async for quirk_id, name, category, description, strength, confidence in rows:
+                yield Quirk.model_construct(
+                    id=quirk_id,
+                    user_id=user_id,
+                    name=name,
+                    category=category,
+                    description=description,
+                    strength=strength,
+                    confidence=confidence
+                )
+
     async def get_all_quirks(self, user_id: str) -> list[Quirk]:
         """
         Get all quirks (active and inactive) for a user.
@@ -830,32 +1183,10 @@ class PersonalityEngine:
             List of all Quirk objects
         """
         try:
-            query = """
-                SELECT id, name, category, description, strength, confidence
-                FROM quirks
-                WHERE user_id = $1
-                ORDER BY is_active DESC, strength DESC
-            """
-
-            rows = await self.db.execute_user_query(user_id, query, (user_id,))
-
-            quirks = [
-                Quirk(
-                    id=str(row['id']),
-                    user_id=user_id,
-                    name=row['name'],
-                    category=row['category'],
-                    description=row['description'],
-                    strength=row['strength'],
-                    confidence=row['confidence']
-                )
-                for row in rows
-            ]
-
-            return quirks
+            return [quirk async for quirk in self.iter_all_quirks(user_id)]
 
         except Exception as e:
-            self.logger.error(f"Failed to get all quirks for user {user_id}: {e}")
+            self.logger.error("Failed to get all quirks for user %s: %s", user_id, e)
             return []
 
     async def get_user_needs(self, user_id: str) -> list[PsychologicalNeed]:
@@ -880,23 +1211,67 @@ class PersonalityEngine:
             rows = await self.db.execute_user_query(user_id, query, (user_id,))
 
             needs = [
-                PsychologicalNeed(
-                    need_type=row['need_type'],
-                    current_level=row['current_level'],
-                    baseline_level=row['baseline_level'],
-                    decay_rate=row['decay_rate'],
-                    trigger_threshold=row['trigger_threshold'],
-                    satisfaction_rate=row['satisfaction_rate']
+                PsychologicalNeed.model_construct(
+                    need_type=need_type,
+                    current_level=current_level,
+                    baseline_level=baseline_level,
+                    decay_rate=decay_rate,
+                    trigger_threshold=trigger_threshold,
+                    satisfaction_rate=satisfaction_rate
                 )
-                for row in rows
+                # Unpack records positionally (column order of the SELECT)
+                for need_type, current_level, baseline_level, decay_rate,
+                    trigger_threshold, satisfaction_rate in rows
             ]
 
             return needs
 
         except Exception as e:
-            self.logger.error(f"Failed to get user needs for user {user_id}: {e}")
+            self.logger.error("Failed to get user needs for user %s: %s", user_id, e)
             return []
 
+    async def get_quirk_aggregates(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get aggregate metrics over a user's active quirks, computed in SQL.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Dictionary with total_quirks, average_strength and average_confidence
+        """
+        query = """
+            SELECT COUNT(*) AS total_quirks,
+                   COALESCE(AVG(strength), 0.0) AS average_strength,
+                   COALESCE(AVG(confidence), 0.0) AS average_confidence
+            FROM quirks
+            WHERE user_id = $1 AND is_active = TRUE
+        """
+
+        row = await self.db.execute_user_fetchrow(user_id, query, (user_id,))
+        return dict(row)
+
+    async def get_need_aggregates(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get aggregate metrics over a user's psychological needs, computed in SQL.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Dictionary with total_needs, average_level and needs_above_threshold
+        """
+        query = """
+            SELECT COUNT(*) AS total_needs,
+                   COALESCE(AVG(current_level), 0.0) AS average_level,
+                   COUNT(*) FILTER (WHERE current_level >= trigger_threshold) AS needs_above_threshold
+            FROM needs
+            WHERE user_id = $1
+        """
+
+        row = await self.db.execute_user_fetchrow(user_id, query, (user_id,))
+        return dict(row)
+
     async def get_evolution_metrics(self, user_id: str) -> Dict[str, Any]:
         """
         Get personality evolution metrics for a user.
@@ -908,48 +1283,29 @@ class PersonalityEngine:
             Dictionary containing evolution metrics
         """
         try:
-            # Get recent personality history
-            history = await self.get_personality_history(user_id, days=30)
+            # PAD variance and the quirk/need aggregates are independent reads; run
+            # them concurrently on separate pool connections
+            variance, quirk_metrics, needs_metrics = await asyncio.gather(
+                self._compute_pad_variance(user_id, days=30),
+                self.get_quirk_aggregates(user_id),
+                self.get_need_aggregates(user_id)
+            )
 
-            if len(history) < 2:
+            if variance is None:
                 return {
                     "status": "insufficient_data",
                     "message": "Need at least 2 personality snapshots to calculate evolution metrics"
                 }
 
-            # Calculate PAD stability (variance)
-            pad_values = {
-                'pleasure': [s.current_pad.pleasure for s in history],
-                'arousal': [s.current_pad.arousal for s in history],
-                'dominance': [s.current_pad.dominance for s in history]
-            }
-
-            import statistics
+            # PAD stability (sample variance per dimension)
             stability = {
-                'pleasure_variance': statistics.variance(pad_values['pleasure']) if len(pad_values['pleasure']) > 1 else 0.0,
-                'arousal_variance': statistics.variance(pad_values['arousal']) if len(pad_values['arousal']) > 1 else 0.0,
-                'dominance_variance': statistics.variance(pad_values['dominance']) if len(pad_values['dominance']) > 1 else 0.0
+                'pleasure_variance': variance.pleasure,
+                'arousal_variance': variance.arousal,
+                'dominance_variance': variance.dominance
             }
 
             # Calculate overall stability score (inverse of average variance)
-            avg_variance = (stability['pleasure_variance'] + stability['arousal_variance'] + stability['dominance_variance']) / 3
-            stability_score = max(0.0, 1.0 - avg_variance)  # Higher score = more stable
-
-            # Get quirk evolution metrics
-            quirks = await self.get_active_quirks(user_id)
-            quirk_metrics = {
-                'total_quirks': len(quirks),
-                'average_strength': sum(q.strength for q in quirks) / len(quirks) if quirks else 0.0,
-                'average_confidence': sum(q.confidence for q in quirks) / len(quirks) if quirks else 0.0
-            }
-
-            # Get needs metrics
-            needs = await self.get_user_needs(user_id)
-            needs_metrics = {
-                'total_needs': len(needs),
-                'average_level': sum(n.current_level for n in needs) / len(needs) if needs else 0.0,
-                'needs_above_threshold': sum(1 for n in needs if n.current_level >= n.trigger_threshold)
-            }
+            stability_score = max(0.0, 1.0 - variance.average)  # Higher score = more stable
 
             return {
                 "status": "success",
@@ -957,11 +1313,11 @@ class PersonalityEngine:
                 "stability_details": stability,
                 "quirk_metrics": quirk_metrics,
                 "needs_metrics": needs_metrics,
-                "snapshots_analyzed": len(history)
+                "snapshots_analyzed": variance.sample_count
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to get evolution metrics for user {user_id}: {e}")
+            self.logger.error("Failed to get evolution metrics for user %s: %s", user_id, e)
             return {
                 "status": "error",
                 "message": str(e)
@@ -979,23 +1335,30 @@ class PersonalityEngine:
             Updated PersonalitySnapshot or None on failure
         """
         try:
-            update_query = """
-                UPDATE personality_state
+            # Return the updated snapshot from the UPDATE itself instead of re-reading it
+            update_query = f"""
+                UPDATE personality_state ps
                 SET pleasure = $1, arousal = $2, dominance = $3,
-                    emotion_label = $4, updated_at = NOW()
-                WHERE user_id = $5 AND is_current = TRUE
+                    emotion_label = $4
+                WHERE ps.user_id = $5 AND ps.is_current = TRUE
+                RETURNING {SNAPSHOT_COLUMNS}
             """
 
             emotion_label = pad_state.to_emotion_octant()
             params = (pad_state.pleasure, pad_state.arousal, pad_state.dominance, emotion_label, user_id)
 
-            await self.db.execute_user_query(user_id, update_query, params)
+            rows = await self.db.execute_user_query(user_id, update_query, params)
+            self.invalidate(user_id)
 
-            # Return updated snapshot
-            return await self.get_personality_snapshot(user_id)
+            if not rows:
+                return None
+
+            snapshot = _snapshot_from_row(user_id, rows[0])
+            self._cache_snapshot(user_id, snapshot)
+            return snapshot
 
         except Exception as e:
-            self.logger.error(f"Failed to override PAD state for user {user_id}: {e}")
+            self.logger.error("Failed to override PAD state for user %s: %s", user_id, e)
             return None
 
     async def get_personality_baseline(self, user_id: str) -> Optional[PersonalitySnapshot]:
@@ -1020,6 +1383,16 @@ class PersonalityEngine:
         Returns:
             BigFiveTraits object or None
         """
+        # Traits only change when a personality is (re)created, so serve them from
+        # a cached snapshot or the longer-lived trait cache when possible
+        snapshot = self._get_cached_snapshot(user_id)
+        if snapshot is not None:
+            return snapshot.big_five
+
+        cached = self._big_five_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < BIG_FIVE_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
             query = """
                 SELECT openness, conscientiousness, extraversion, agreeableness, neuroticism
@@ -1027,26 +1400,121 @@ class PersonalityEngine:
                 WHERE user_id = $1 AND is_current = TRUE
             """
 
-            rows = await self.db.execute_user_query(user_id, query, (user_id,))
+            row = await self.db.execute_user_fetchrow(user_id, query, (user_id,))
 
-            if not rows:
+            if row is None:
                 return None
 
-            row = rows[0]
-            return BigFiveTraits(
-                openness=row['openness'],
-                conscientiousness=row['conscientiousness'],
-                extraversion=row['extraversion'],
-                agreeableness=row['agreeableness'],
-                neuroticism=row['neuroticism']
+            # Unpack the record positionally (column order of the SELECT)
+            openness, conscientiousness, extraversion, agreeableness, neuroticism = row
+            traits = BigFiveTraits.model_construct(
+                openness=openness,
+                conscientiousness=conscientiousness,
+                extraversion=extraversion,
+                agreeableness=agreeableness,
+                neuroticism=neuroticism
             )
 
+            self._big_five_cache.pop(user_id, None)
+            self._big_five_cache[user_id] = (time.monotonic(), traits)
+            if len(self._big_five_cache) > BIG_FIVE_CACHE_MAX_USERS:
+                self._big_five_cache.pop(next(iter(self._big_five_cache)))
+            return traits
+
         except Exception as e:
-            self.logger.error(f"Failed to get Big Five traits for user {user_id}: {e}")
+            self.logger.error("Failed to get Big Five traits for user %s: %s", user_id, e)
             return None
 
 
-    async def get_personality_stability(self, user_id: str, days: int = 14) -> float:
+    async def _compute_pad_variance(self, user_id: str, days: int) -> Optional[PADVariance]:
+        """
+        PAD variance over the last `days` days, shared by the evolution and
+        stability metrics. Results are cached for ``snapshot_ttl`` seconds and
+        dropped on writes.
+
+        Args:
+            user_id: Discord user ID
+            days: Number of days of history to analyze
+
+        Returns:
+            PADVariance, or None with fewer than two snapshots in the window
+        """
+        cached = self._variance_cache.get(user_id, {}).get(days)
+        if cached is not None and time.monotonic() - cached[0] < self.snapshot_ttl:
+            return cached[1]
+
+        row = None
+        if days == PAD_STATS_WINDOW_DAYS:
+            row = await self._fetch_pad_stats(user_id)
+
+        if row is None:
+            # Let Postgres aggregate the window instead of shipping every snapshot
+            variance_query = """
+                SELECT var_samp(pleasure) AS pleasure,
+                       var_samp(arousal) AS arousal,
+                       var_samp(dominance) AS dominance,
+                       COUNT(*) AS sample_count
+                FROM personality_state
+                WHERE user_id = $1 AND timestamp >= NOW() - make_interval(days => $2)
+            """
+            row = await self.db.execute_user_fetchrow(user_id, variance_query, (user_id, days))
+
+        if row is None or row['sample_count'] < 2:
+            return None
+
+        variance = PADVariance(
+            pleasure=float(row['pleasure']),
+            arousal=float(row['arousal']),
+            dominance=float(row['dominance']),
+            sample_count=row['sample_count']
+        )
+        self._variance_cache.setdefault(user_id, {})[days] = (time.monotonic(), variance)
+        if len(self._variance_cache) > SNAPSHOT_CACHE_MAX_USERS:
+            self._variance_cache.pop(next(iter(self._variance_cache)))
+        return variance
+
+    async def _fetch_pad_stats(self, user_id: str):
+        """
+        Read a user's precomputed PAD variance from personality_pad_stats.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Row with pleasure, arousal, dominance and sample_count, or None when
+            the view has no fresh row for the user
+        """
+        query = """
+            SELECT pleasure, arousal, dominance, sample_count
+            FROM personality_pad_stats
+            WHERE user_id = $1 AND refreshed_at >= NOW() - make_interval(secs => $2)
+        """
+
+        try:
+            return await self.db.execute_user_fetchrow(
+                user_id, query, (user_id, float(PAD_STATS_MAX_AGE_SECONDS))
+            )
+        except Exception as e:
+            # View not migrated yet or unavailable; the live aggregate still works
+            self.logger.debug("PAD stats view unavailable for user %s: %s", user_id, e)
+            return None
+
+    async def refresh_pad_stats(self):
+        """
+        Refresh the personality_pad_stats materialized view without blocking readers.
+        """
+        try:
+            await self.db.execute_admin_query(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY personality_pad_stats"
+            )
+        except Exception as e:
+            self.logger.error("Failed to refresh PAD stats view: %s", e)
+            raise PersonalityEngineError(
+                message=f"Failed to refresh PAD stats view: {e!s}",
+                operation="refresh_pad_stats"
+            ) from e
+
+    async def get_personality_stability(self, user_id: str, days: int = PAD_STATS_WINDOW_DAYS) -> float:
         """
         Calculate personality stability score based on PAD variance over time.
 
@@ -1058,30 +1526,17 @@ class PersonalityEngine:
             Stability score from 0.0 (unstable) to 1.0 (very stable)
         """
         try:
-            history = await self.get_personality_history(user_id, days=days)
+            variance = await self._compute_pad_variance(user_id, days=days)
 
-            if len(history) < 2:
+            if variance is None:
                 return 1.0  # Assume stable if not enough data
 
-            # Calculate variance for each PAD dimension
-            import statistics
-            pleasure_values = [s.current_pad.pleasure for s in history]
-            arousal_values = [s.current_pad.arousal for s in history]
-            dominance_values = [s.current_pad.dominance for s in history]
-
-            pleasure_variance = statistics.variance(pleasure_values) if len(pleasure_values) > 1 else 0.0
-            arousal_variance = statistics.variance(arousal_values) if len(arousal_values) > 1 else 0.0
-            dominance_variance = statistics.variance(dominance_values) if len(dominance_values) > 1 else 0.0
-
-            # Average variance
-            avg_variance = (pleasure_variance + arousal_variance + dominance_variance) / 3.0
-
             # Convert variance to stability score (inverse relationship)
             # Variance of 0 = stability 1.0, higher variance = lower stability
-            stability_score = max(0.0, min(1.0, 1.0 - (avg_variance * 2.0)))
+            stability_score = max(0.0, min(1.0, 1.0 - (variance.average * 2.0)))
 
             return stability_score
 
         except Exception as e:
-            self.logger.error(f"Failed to calculate personality stability for user {user_id}: {e}")
+            self.logger.error("Failed to calculate personality stability for user %s: %s", user_id, e)
             return 0.5  # Return neutral stability on error
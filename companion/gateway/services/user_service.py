@@ -4,20 +4,59 @@ Handles user lifecycle management, profile creation, and transactional operation
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Awaitable, Callable, Hashable, TYPE_CHECKING
 from datetime import datetime, timedelta
 
 from ..database import DatabaseManager
 from ..models.user import UserProfile
 from ..models.personality import PersonalitySnapshot
 from ..models.interaction import InteractionRecord
-from ..services.letta_service import LettaService
-from ..services.personality_engine import PersonalityEngine
 from ..utils.exceptions import UserCreationError, UserNotFoundError
 
+if TYPE_CHECKING:
+    from ..services.letta_service import LettaService
+    from ..services.personality_engine import PersonalityEngine
+
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched user profile is served from memory before re-reading it
+PROFILE_CACHE_TTL_SECONDS = 60.0
+
+# Maximum number of cached user profiles
+PROFILE_CACHE_MAX_USERS = 10_000
+
+# Default psychological needs for a new user: (need_type, current_level, baseline_level)
+DEFAULT_NEED_ROWS = (
+    ("social", 0.5, 0.5),
+    ("validation", 0.5, 0.5),
+    ("intellectual", 0.5, 0.5),
+    ("creative", 0.5, 0.5),
+    ("rest", 0.5, 0.5),
+)
+
+# Seconds an aggregate count is served from memory before re-querying
+COUNT_CACHE_TTL_SECONDS = 30.0
+
+# Maximum number of cached aggregate counts
+COUNT_CACHE_MAX_KEYS = 64
+
+# Rows fetched per round trip when streaming users through a cursor
+USER_CURSOR_PREFETCH = 200
+
+# Buffered interactions are written at least this often
+INTERACTION_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Buffered interactions that trigger an immediate flush
+INTERACTION_FLUSH_BATCH_SIZE = 500
+
+# Attempts made to delete an orphaned Letta agent before giving up
+AGENT_DELETE_MAX_ATTEMPTS = 3
+
+# Backoff before the first agent delete retry; doubled on each further attempt
+AGENT_DELETE_RETRY_BASE_SECONDS = 1.0
+
 
 class UserService:
     """
@@ -25,10 +64,23 @@ class UserService:
     Handles user profile creation, initialization, and state management.
     """
     
-    def __init__(self, db: DatabaseManager, letta_service: LettaService, personality_engine: PersonalityEngine):
+    def __init__(self, db: DatabaseManager, letta_service: "LettaService", personality_engine: "PersonalityEngine"):
         self.db = db
         self.letta_service = letta_service
         self.personality_engine = personality_engine
+        # user_id -> (monotonic time fetched, profile), least recently used first
+        self._profile_cache: Dict[str, Tuple[float, UserProfile]] = {}
+        # (aggregate name, window start) -> (monotonic time fetched, count), oldest first
+        self._count_cache: Dict[Tuple[Hashable, ...], Tuple[float, int]] = {}
+        # Letta agent IDs awaiting deletion off the request path
+        self._agent_delete_queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._agent_cleanup_task: Optional[asyncio.Task] = None
+        # Interactions waiting to be written in the next batch, each with the future
+        # that reports whether it was stored
+        self._interaction_buf: List[Tuple[InteractionRecord, "asyncio.Future[bool]"]] = []
+        self._interaction_buf_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._interaction_flush_task: Optional[asyncio.Task] = None
     
     async def create_user(self, discord_id: str) -> UserProfile:
         """
@@ -66,60 +118,116 @@ class UserService:
                 # Mark that agent was successfully created
                 created_agent = True
 
-                # Step 4: Update user profile with agent mapping
-                await tx.update_user_profile(profile_id, {
+                # Steps 4-5: Record the agent mapping and seed psychological needs
+                # in one round trip
+                await tx.complete_user_profile(profile_id, {
                     'letta_agent_id': agent_id,
                     'personality_initialized': True,
                     'initialization_completed': True
-                })
-
-                # Step 5: Initialize psychological needs
-                await self._initialize_psychological_needs(discord_id, tx)
+                }, DEFAULT_NEED_ROWS)
 
                 await tx.commit()
+                self._profile_cache.pop(discord_id, None)
                 user_profile = await self.get_user_profile(discord_id)
                 return user_profile
 
             except Exception as e:
                 await tx.rollback()
-                # Cleanup any partially created Letta agent
+                # Cleanup any partially created Letta agent in the background
                 if created_agent:
-                    try:
-                        await self.letta_service.delete_agent(agent_id)
-                    except Exception as cleanup_error:
-                        logger.error(f"Failed to cleanup agent {agent_id} after user creation failure: {cleanup_error}")
+                    self._schedule_agent_delete(agent_id)
                 raise UserCreationError(f"User creation failed: {str(e)}")
 
-    async def _initialize_psychological_needs(self, user_id: str, tx):
+    def _schedule_agent_delete(self, agent_id: str):
         """
-        Initialize the psychological needs for a new user
+        Queue a Letta agent for deletion by the background cleanup worker
+        The worker is started on first use so the service can be built outside a running loop
         """
-        from ..models.personality import PsychologicalNeed
-        
-        default_needs = [
-            PsychologicalNeed(need_type="social", current_level=0.5, baseline_level=0.5),
-            PsychologicalNeed(need_type="validation", current_level=0.5, baseline_level=0.5),
-            PsychologicalNeed(need_type="intellectual", current_level=0.5, baseline_level=0.5),
-            PsychologicalNeed(need_type="creative", current_level=0.5, baseline_level=0.5),
-            PsychologicalNeed(need_type="rest", current_level=0.5, baseline_level=0.5)
-        ]
-        
-        for need in default_needs:
-            await tx.insert_need(user_id, need)
+        if self._agent_cleanup_task is None or self._agent_cleanup_task.done():
+            self._agent_cleanup_task = asyncio.create_task(self._agent_cleanup_worker())
+        self._agent_delete_queue.put_nowait(agent_id)
+
+    async def _agent_cleanup_worker(self):
+        """
+        Delete queued Letta agents, retrying failures with exponential backoff
+        """
+        while True:
+            agent_id = await self._agent_delete_queue.get()
+            try:
+                for attempt in range(1, AGENT_DELETE_MAX_ATTEMPTS + 1):
+                    try:
+                        if await self.letta_service.delete_agent(agent_id):
+                            break
+                        error = "delete request was rejected"
+                    except Exception as e:
+                        error = e
+                    if attempt < AGENT_DELETE_MAX_ATTEMPTS:
+                        await asyncio.sleep(AGENT_DELETE_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+                    else:
+                        logger.error(f"Giving up deleting agent {agent_id} after {attempt} attempts: {error}")
+            finally:
+                self._agent_delete_queue.task_done()
+
+    async def close(self, timeout: float = 10.0):
+        """
+        Flush buffered interactions, drain pending Letta agent deletions and stop the workers
+        """
+        if self._interaction_flush_task is not None:
+            self._interaction_flush_task.cancel()
+            try:
+                await self._interaction_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._interaction_flush_task = None
+        await self.flush_interactions()
+
+        if self._agent_cleanup_task is None:
+            return
+        try:
+            await asyncio.wait_for(self._agent_delete_queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{self._agent_delete_queue.qsize()} Letta agent deletions still pending at shutdown"
+            )
+        self._agent_cleanup_task.cancel()
+        try:
+            await self._agent_cleanup_task
+        except asyncio.CancelledError:
+            pass
+        self._agent_cleanup_task = None
 
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """
         Retrieve a user profile by user_id
+        Profiles are cached for PROFILE_CACHE_TTL_SECONDS and dropped on writes
         """
+        cached = self._profile_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < PROFILE_CACHE_TTL_SECONDS:
+            # Move to the back so eviction drops the least recently used entry
+            self._profile_cache[user_id] = self._profile_cache.pop(user_id)
+            return cached[1]
+
         try:
             record = await self.db.get_user_profile(user_id)
             if record:
-                # Convert asyncpg.Record to UserProfile model
-                return UserProfile(**dict(record))
+                # Convert asyncpg.Record to UserProfile model (rows are trusted)
+                user_profile = UserProfile.from_record(record)
+                self._cache_profile(user_id, user_profile)
+                return user_profile
             return None
         except Exception as e:
             logger.error(f"Error retrieving user profile for {user_id}: {e}")
-            return None
+            # Serve the expired profile, if any, while the database is unavailable
+            return cached[1] if cached is not None else None
+
+    def _cache_profile(self, user_id: str, user_profile: UserProfile):
+        """
+        Store a freshly read profile, evicting the least recently used entry when full
+        """
+        self._profile_cache.pop(user_id, None)
+        self._profile_cache[user_id] = (time.monotonic(), user_profile)
+        if len(self._profile_cache) > PROFILE_CACHE_MAX_USERS:
+            self._profile_cache.pop(next(iter(self._profile_cache)))
 
     async def get_user_by_discord_username(self, discord_username: str) -> Optional[UserProfile]:
         """
@@ -131,62 +239,47 @@ class UserService:
             logger.error(f"Error retrieving user by Discord username {discord_username}: {e}")
             return None
 
-    async def update_user_profile(self, user_id: str, updates: Dict[str, Any]) -> bool:
+    async def update_user_profile(self, user_id: str, updates: Dict[str, Any],
+                                  touch_last_active: bool = False) -> bool:
         """
         Update user profile fields
+        touch_last_active stamps last_active with the database server's NOW()
         """
         try:
-            return await self.db.update_user_profile(user_id, updates)
+            return await self.db.update_user_profile(user_id, updates, touch_last_active)
         except Exception as e:
             logger.error(f"Error updating user profile for {user_id}: {e}")
             return False
+        finally:
+            self._profile_cache.pop(user_id, None)
 
     async def delete_user(self, user_id: str) -> bool:
         """
         Transactionally mark a user as deleted and deactivate their account
         """
         try:
-            # First, get the user profile to check for agent ID
-            user_profile = await self.get_user_profile(user_id)
-            if not user_profile:
+            # Mark the user deleted and read back the agent ID in one statement
+            record = await self.db.execute_user_fetchrow(
+                user_id,
+                """
+                UPDATE user_profiles
+                SET status = 'deleted', last_active = NOW()
+                WHERE user_id = $1
+                RETURNING letta_agent_id
+                """,
+                (user_id,)
+            )
+            self._profile_cache.pop(user_id, None)
+            if record is None:
                 logger.warning(f"User {user_id} not found for deletion")
                 return False
-                
-            agent_id = user_profile.letta_agent_id
-            
-            # Open a database transaction for atomic operations
-            async with self.db.get_transaction() as tx:
-                # Update user status to deleted within the transaction
-                updates = {
-                    'status': 'deleted',
-                    'last_active': datetime.utcnow()
-                }
-                
-                # Update user profile within transaction
-                await tx.execute_user_query(
-                    user_id,
-                    """
-                    UPDATE user_profiles 
-                    SET status=$1, last_active=$2 
-                    WHERE user_id=$3
-                    """,
-                    (updates['status'], updates['last_active'], user_id)
-                )
-                
-                # Commit the transaction
-                await tx.commit()
+
+            agent_id = record['letta_agent_id']
             
-            # After successful DB commit, delete the associated Letta agent
-            # If this fails, we can't rollback the DB changes, but we should log the error
+            # The DB change is committed; the Letta agent is deleted in the background
             if agent_id:
-                try:
-                    await self.letta_service.delete_agent(agent_id)
-                except Exception as agent_error:
-                    logger.error(f"Failed to delete agent {agent_id} for user {user_id} after DB update: {agent_error}")
-                    # In a production system, you might want to schedule a retry or have a compensating action
-                    # For now, we still return True since the main operation (user deletion) succeeded
-                    return True
-            
+                self._schedule_agent_delete(agent_id)
+
             return True
         except Exception as e:
             logger.error(f"Error deleting user {user_id}: {e}")
@@ -197,11 +290,7 @@ class UserService:
         Deactivate a user account without deleting it
         """
         try:
-            updates = {
-                'status': 'inactive',
-                'last_active': datetime.utcnow()
-            }
-            return await self.update_user_profile(user_id, updates)
+            return await self.update_user_profile(user_id, {'status': 'inactive'}, touch_last_active=True)
         except Exception as e:
             logger.error(f"Error deactivating user {user_id}: {e}")
             return False
@@ -211,11 +300,7 @@ class UserService:
         Reactivate a user account
         """
         try:
-            updates = {
-                'status': 'active',
-                'last_active': datetime.utcnow()
-            }
-            return await self.update_user_profile(user_id, updates)
+            return await self.update_user_profile(user_id, {'status': 'active'}, touch_last_active=True)
         except Exception as e:
             logger.error(f"Error reactivating user {user_id}: {e}")
             return False
@@ -229,38 +314,70 @@ class UserService:
             raise ValueError(f"Invalid status: {new_status}. Valid statuses: {valid_statuses}")
         
         try:
-            updates = {
-                'status': new_status,
-                'last_active': datetime.utcnow()
-            }
+            updates = {'status': new_status}
             if reason:
                 updates['status_change_reason'] = reason
             
-            success = await self.update_user_profile(user_id, updates)
-            if success:
-                return await self.get_user_profile(user_id)
-            else:
+            # Read the updated row back from the UPDATE itself
+            self._profile_cache.pop(user_id, None)
+            record = await self.db.update_user_profile_returning(user_id, updates, touch_last_active=True)
+            if not record:
                 return None
+
+            user_profile = UserProfile.from_record(record)
+            self._cache_profile(user_id, user_profile)
+            return user_profile
         except Exception as e:
             logger.error(f"Error updating status for user {user_id}: {e}")
             return None
 
+    async def iter_users(self, skip: int = 0, limit: int = 50) -> AsyncIterator[UserProfile]:
+        """
+        Stream a page of users, newest first
+        Rows arrive through a server-side cursor in batches of USER_CURSOR_PREFETCH
+        """
+        async for record in self.db.iter_all_users(skip=skip, limit=limit, prefetch=USER_CURSOR_PREFETCH):
+            yield UserProfile.from_record(record)
+
     async def get_all_users(self, skip: int = 0, limit: int = 50) -> List[UserProfile]:
         """
         Get a paginated list of all users
         """
         try:
-            return await self.db.get_all_users(skip=skip, limit=limit)
+            return [user async for user in self.iter_users(skip=skip, limit=limit)]
         except Exception as e:
             logger.error(f"Error getting all users: {e}")
             return []
 
+    async def _cached_count(self, key: Tuple[Hashable, ...], fetch: Callable[[], Awaitable[int]]) -> int:
+        """
+        Return an aggregate count, re-running fetch at most once per COUNT_CACHE_TTL_SECONDS per key
+        """
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and now - cached[0] < COUNT_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        count = await fetch()
+        self._count_cache.pop(key, None)
+        self._count_cache[key] = (now, count)
+        if len(self._count_cache) > COUNT_CACHE_MAX_KEYS:
+            self._count_cache.pop(next(iter(self._count_cache)))
+        return count
+
+    @staticmethod
+    def _window_start(window: timedelta) -> datetime:
+        """
+        Start of a trailing time window, truncated to the minute so repeated calls share a cache key
+        """
+        return (datetime.utcnow() - window).replace(second=0, microsecond=0)
+
     async def get_total_user_count(self) -> int:
         """
         Get the total count of users in the system
         """
         try:
-            return await self.db.get_total_user_count()
+            return await self._cached_count(("users",), self.db.get_total_user_count)
         except Exception as e:
             logger.error(f"Error getting total user count: {e}")
             return 0
@@ -271,26 +388,81 @@ class UserService:
         """
         try:
             if hours:
-                since = datetime.utcnow() - timedelta(hours=hours)
+                window = timedelta(hours=hours)
             elif days:
-                since = datetime.utcnow() - timedelta(days=days)
+                window = timedelta(days=days)
             else:
-                since = datetime.utcnow() - timedelta(hours=24)  # Default to 24 hours
-            
-            return await self.db.get_active_users_count(since=since)
+                window = timedelta(hours=24)  # Default to 24 hours
+            since = self._window_start(window)
+
+            return await self._cached_count(
+                ("active_users", since), lambda: self.db.get_active_users_count(since=since)
+            )
         except Exception as e:
             logger.error(f"Error getting active users count: {e}")
             return 0
 
-    async def log_interaction(self, interaction: InteractionRecord) -> bool:
+    def log_interaction(self, interaction: InteractionRecord) -> "asyncio.Future[bool]":
         """
-        Log an interaction between user and AI companion
+        Queue an interaction between user and AI companion for logging
+        The record is written in a batch within INTERACTION_FLUSH_INTERVAL_SECONDS, so it is
+        not visible to reads until then. Returns a future that resolves to True once the row
+        is stored, or False if it could not be written. Await it to wait for the write, or
+        attach a done callback to learn the outcome without blocking.
+        Must be called from within the running event loop.
         """
-        try:
-            return await self.db.log_interaction(interaction)
-        except Exception as e:
-            logger.error(f"Error logging interaction for user {interaction.user_id}: {e}")
-            return False
+        if self._interaction_flush_task is None or self._interaction_flush_task.done():
+            self._interaction_flush_task = asyncio.create_task(self._flush_interactions_loop())
+        written = asyncio.get_running_loop().create_future()
+        self._interaction_buf.append((interaction, written))
+        if len(self._interaction_buf) >= INTERACTION_FLUSH_BATCH_SIZE:
+            self._interaction_buf_full.set()
+        return written
+
+    async def _flush_interactions_loop(self):
+        """
+        Write buffered interactions on a timer, or sooner once the buffer is full
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._interaction_buf_full.wait(), timeout=INTERACTION_FLUSH_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            # Shielded so stopping the loop never abandons a batch mid-write
+            await asyncio.shield(self.flush_interactions())
+
+    async def flush_interactions(self):
+        """
+        Write all buffered interactions in one batch and resolve their futures
+        If the batch is rejected, rows are retried one by one so a bad record only loses itself
+        """
+        async with self._flush_lock:
+            self._interaction_buf_full.clear()
+            batch, self._interaction_buf = self._interaction_buf, []
+            if not batch:
+                return
+            try:
+                await self.db.log_interactions_batch([interaction for interaction, _ in batch])
+                results = [True] * len(batch)
+            except Exception as e:
+                logger.error(f"Error logging batch of {len(batch)} interactions, retrying individually: {e}")
+                results = []
+                for interaction, _ in batch:
+                    stored = await self.db.log_interaction(interaction)
+                    if not stored:
+                        # Keep the full record so it can be replayed by hand
+                        logger.error(
+                            f"Dropped interaction for user {interaction.user_id} "
+                            f"(session {interaction.session_id}, {interaction.timestamp.isoformat()}): "
+                            f"{interaction.model_dump_json()}"
+                        )
+                    results.append(stored)
+
+            for (_, written), stored in zip(batch, results):
+                if not written.done():
+                    written.set_result(stored)
 
     async def get_recent_interactions(self, user_id: str, limit: int = 10) -> List[InteractionRecord]:
         """
@@ -307,7 +479,7 @@ class UserService:
         Get the total count of interactions in the system
         """
         try:
-            return await self.db.get_total_interaction_count()
+            return await self._cached_count(("interactions",), self.db.get_total_interaction_count)
         except Exception as e:
             logger.error(f"Error getting total interaction count: {e}")
             return 0
@@ -317,8 +489,10 @@ class UserService:
         Get the count of interactions in the specified time range
         """
         try:
-            since = datetime.utcnow() - timedelta(hours=hours)
-            return await self.db.get_interaction_count_since(since)
+            since = self._window_start(timedelta(hours=hours))
+            return await self._cached_count(
+                ("recent_interactions", since), lambda: self.db.get_interaction_count_since(since)
+            )
         except Exception as e:
             logger.error(f"Error getting recent interaction count: {e}")
             return 0
@@ -8,7 +8,7 @@ Security improvements:
 - Parameterized queries only (no string interpolation)
 """
 import re
-from typing import Optional, Any, Tuple, List
+from typing import Optional, Any, Tuple, List, AsyncIterator
 import logging
 import sqlparse
 from sqlparse.sql import Where, Identifier, Comparison, Token, IdentifierList
@@ -219,6 +219,8 @@ class QueryExecutor:
                 return await connection.fetch(query, *(params or ()))
             elif query_stripped.startswith('INSERT') and 'RETURNING' in query_stripped:
                 return await connection.fetchrow(query, *(params or ()))
+            elif query_stripped.startswith(('UPDATE', 'DELETE')) and 'RETURNING' in query_stripped:
+                return await connection.fetch(query, *(params or ()))
             else:
                 return await connection.execute(query, *(params or ()))
         except Exception:
@@ -226,23 +228,16 @@ class QueryExecutor:
             raise
 
     @staticmethod
-    async def execute_scoped_query(connection, query: str, user_id: str, params: Optional[tuple] = None) -> Any:
+    def _validate_scoped_query(query: str) -> None:
         """
-        Execute a user-scoped query on a given connection with validation.
+        Validate user scoping by statement type.
 
         Args:
-            connection: asyncpg connection or pool
-            query: SQL query to execute
-            user_id: User ID for scoping
-            params: Query parameters (user_id will be prepended automatically)
-
-        Returns:
-            Query results based on query type (fetch/fetchrow/execute result)
+            query: SQL query to validate
 
         Raises:
-            SecurityError: If query is complex or doesn't contain user_id after injection
+            SecurityError: If the query doesn't filter or insert by user_id
         """
-        # Validate user scoping by statement type
         query_head = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)
         query_head = re.sub(r'--.*?$', '', query_head, flags=re.MULTILINE).strip().upper()
         first_kw_match = re.match(r'^[A-Z]+', query_head)
@@ -258,6 +253,97 @@ class QueryExecutor:
             if "USER_ID" not in query_head:
                 logger.exception(f"INSERT without user_id column detected: {query[:200]}")
                 raise SecurityError("INSERT must include user_id column/value for multi-user isolation.")
+        elif first_kw == "WITH":
+            # Same basic guard for data-modifying CTEs, whose inner statements vary
+            if "USER_ID" not in query_head:
+                logger.exception(f"CTE without user_id detected: {query[:200]}")
+                raise SecurityError("CTE queries must reference user_id for multi-user isolation.")
+
+    @staticmethod
+    async def fetch_scoped_row(connection, query: str, user_id: str, params: Optional[tuple] = None) -> Any:
+        """
+        Execute a user-scoped query and return only its first row.
+
+        Args:
+            connection: asyncpg connection or pool
+            query: SQL query to execute
+            user_id: User ID for scoping
+            params: Query parameters
+
+        Returns:
+            First record, or None if the query returned no rows
+
+        Raises:
+            SecurityError: If the query doesn't contain user_id
+        """
+        QueryExecutor._validate_scoped_query(query)
+        return await connection.fetchrow(query, *(params or ()))
+
+    @staticmethod
+    async def fetch_scoped_value(connection, query: str, user_id: str, params: Optional[tuple] = None) -> Any:
+        """
+        Execute a user-scoped query and return the first column of its first row.
+
+        Args:
+            connection: asyncpg connection or pool
+            query: SQL query to execute
+            user_id: User ID for scoping
+            params: Query parameters
+
+        Returns:
+            Scalar value, or None if the query returned no rows
+
+        Raises:
+            SecurityError: If the query doesn't contain user_id
+        """
+        QueryExecutor._validate_scoped_query(query)
+        return await connection.fetchval(query, *(params or ()))
+
+    @staticmethod
+    async def iter_scoped_rows(
+        connection, query: str, user_id: str, params: Optional[tuple] = None, prefetch: int = 100
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a user-scoped query's rows through a server-side cursor.
+
+        The connection must be inside a transaction for as long as the stream
+        is consumed.
+
+        Args:
+            connection: asyncpg connection in a transaction
+            query: SQL query to execute
+            user_id: User ID for scoping
+            params: Query parameters
+            prefetch: Rows fetched per round trip
+
+        Yields:
+            Records, one at a time
+
+        Raises:
+            SecurityError: If the query doesn't contain user_id
+        """
+        QueryExecutor._validate_scoped_query(query)
+        async for record in connection.cursor(query, *(params or ()), prefetch=prefetch):
+            yield record
+
+    @staticmethod
+    async def execute_scoped_query(connection, query: str, user_id: str, params: Optional[tuple] = None) -> Any:
+        """
+        Execute a user-scoped query on a given connection with validation.
+
+        Args:
+            connection: asyncpg connection or pool
+            query: SQL query to execute
+            user_id: User ID for scoping
+            params: Query parameters (user_id will be prepended automatically)
+
+        Returns:
+            Query results based on query type (fetch/fetchrow/execute result)
+
+        Raises:
+            SecurityError: If query is complex or doesn't contain user_id after injection
+        """
+        QueryExecutor._validate_scoped_query(query)
         
         # Use the query and params as-is (no injection needed with explicit validation)
         scoped_query = query
@@ -306,6 +392,9 @@ class QueryExecutor:
                 else:
                     return await connection.execute(scoped_query, *scoped_params)
             elif query_stripped.startswith('UPDATE') or query_stripped.startswith('DELETE'):
+                # RETURNING yields the affected rows instead of a status string
+                if 'RETURNING' in query_stripped:
+                    return await connection.fetch(scoped_query, *scoped_params)
                 return await connection.execute(scoped_query, *scoped_params)
             else:
                 # For other queries (CREATE, DROP, ALTER, etc.), execute directly
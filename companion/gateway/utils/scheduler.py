@@ -42,6 +42,7 @@ class SchedulerService:
         await self._add_memory_maintenance_job()
         await self._add_needs_decay_job()
         await self._add_user_engagement_check_job()
+        await self._add_pad_stats_refresh_job()
         
         # Start the scheduler
         self.scheduler.start()
@@ -119,6 +120,19 @@ class SchedulerService:
         )
         self.logger.info("Added user engagement check job")
     
+    async def _add_pad_stats_refresh_job(self):
+        """Add the PAD stability statistics refresh job."""
+        # Refresh the personality_pad_stats materialized view every 5 minutes
+        self.scheduler.add_job(
+            func=self._refresh_pad_stats,
+            trigger=IntervalTrigger(minutes=5),
+            id='pad_stats_refresh',
+            name='Refresh PAD stability statistics',
+            replace_existing=True,
+            max_instances=1
+        )
+        self.logger.info("Added PAD stats refresh job")
+    
     async def _run_nightly_reflection(self):
         """Wrapper function to run the nightly reflection process."""
         try:
@@ -245,28 +259,9 @@ class SchedulerService:
         try:
             self.logger.info("Starting needs decay...")
             
-            # Get all active users
-            active_users = await self.services.db.get_all_active_users()
-
-            decayed_count = 0
-            for user_id in active_users:
-                try:
-                    # Use personality engine which returns PsychologicalNeed models
-                    needs = await self.services.personality.get_user_needs(user_id)
-
-                    for need in needs:
-                        # Apply decay rate based on time elapsed
-                        hours_since_update = 1  # Assuming hourly job
-                        decay_amount = need.decay_rate * hours_since_update
-                        # Apply decay as a negative delta via personality engine
-                        await self.services.personality.update_need_level(
-                            user_id, need.need_type, -decay_amount
-                        )
-                        decayed_count += 1
-                        
-                except Exception:
-                    self.logger.exception(f"Error decaying needs for user {user_id}")
-                    continue
+            # Decay every user's needs with a single set-based update
+            hours_since_update = 1  # Assuming hourly job
+            decayed_count = await self.services.personality.decay_needs(hours=hours_since_update)
             
             self.logger.info(f"Needs decay completed. Updated {decayed_count} needs")
             
@@ -277,6 +272,19 @@ class SchedulerService:
             except Exception:
                 pass
     
+    async def _refresh_pad_stats(self):
+        """Refresh precomputed PAD variance used for stability scoring."""
+        try:
+            await self.services.personality.refresh_pad_stats()
+            self.logger.debug("PAD stats refresh completed")
+            
+        except Exception as e:
+            self.logger.exception("Error refreshing PAD stats")
+            try:
+                await self.services.db.log_background_job_error("pad_stats_refresh", str(e))
+            except Exception:
+                pass
+    
     async def _check_user_engagement(self):
         """Check user engagement and system health."""
         try:
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 
 from companion.gateway.models.memory import Memory
 from companion.gateway.services.memory_manager import MemoryManager
+from companion.gateway.utils.exceptions import MemoryManagerError
 
 
 @pytest.mark.asyncio
@@ -444,4 +445,178 @@ class TestMemoryManager:
         assert importance_scorer_mock.score_importance.call_count == 2
         
         # Verify the important memory scored higher
-        # This would require checking the actual calls, which is done by the side_effect above
\ No newline at end of file
+        # This would require checking the actual calls, which is done by the side_effect above
+
+    async def test_collection_exists_is_cached_until_ttl(self):
+        """Test collection existence checks are served from cache within the TTL."""
+        # Setup
+        qdrant_mock = AsyncMock()
+        qdrant_mock.collection_exists.return_value = True
+        
+        memory_manager = MemoryManager(
+            qdrant_client=qdrant_mock,
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+        
+        # Execute
+        assert await memory_manager._collection_exists('episodic_test_user_9') is True
+        assert await memory_manager._collection_exists('episodic_test_user_9') is True
+        
+        # Assert - second check is a cache hit
+        qdrant_mock.collection_exists.assert_called_once_with('episodic_test_user_9')
+        
+        # Expire the cached entry and check again
+        checked_at, exists = memory_manager._exists_cache['episodic_test_user_9']
+        memory_manager._exists_cache['episodic_test_user_9'] = (checked_at - 60, exists)
+        await memory_manager._collection_exists('episodic_test_user_9')
+        assert qdrant_mock.collection_exists.call_count == 2
+
+    async def test_migrate_memories_stream_reports_progress_per_batch(self):
+        """Test streaming migration yields cumulative progress for each committed batch."""
+        # Setup
+        qdrant_mock = AsyncMock()
+        qdrant_mock.collection_exists.side_effect = lambda name: name == 'episodic_source_user'
+        qdrant_mock.count.return_value = MagicMock(count=3)
+        page_one = [MagicMock(id=i, vector=[0.1, 0.2], payload={}) for i in range(2)]
+        page_two = [MagicMock(id=2, vector=[0.3, 0.4], payload={})]
+        qdrant_mock.scroll.side_effect = [(page_one, 2), (page_two, None)]
+        
+        memory_manager = MemoryManager(
+            qdrant_client=qdrant_mock,
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+        
+        # Execute - only the episodic source exists, scrolled as a single shard
+        updates = [
+            progress async for progress in memory_manager.migrate_memories_stream(
+                'source_user', 'target_user', batch_size=2, scroll_shards=1
+            )
+        ]
+        
+        # Assert
+        assert [update.batch_count for update in updates] == [2, 1]
+        assert [update.migrated_count for update in updates] == [2, 3]
+        assert all(update.collection == 'episodic_target_user' for update in updates)
+        assert updates[-1].total_estimate == 3
+        assert qdrant_mock.upsert.call_count == 2
+
+    async def test_migrate_memories_stops_other_collection_on_failure(self):
+        """Test a failed collection migration cancels the concurrent one before raising."""
+        # Setup
+        qdrant_mock = AsyncMock()
+        qdrant_mock.collection_exists.return_value = True
+        qdrant_mock.count.return_value = MagicMock(count=10)
+        semantic_scrolls = 0
+
+        async def scroll(collection_name, offset=None, **kwargs):
+            nonlocal semantic_scrolls
+            await asyncio.sleep(0)
+            if collection_name == 'episodic_source_user':
+                raise RuntimeError('scroll failed')
+            semantic_scrolls += 1
+            return [MagicMock(id=semantic_scrolls, vector=[0.1], payload={})], semantic_scrolls
+
+        qdrant_mock.scroll.side_effect = scroll
+
+        memory_manager = MemoryManager(
+            qdrant_client=qdrant_mock,
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+
+        # Execute
+        with pytest.raises(RuntimeError):
+            await memory_manager.migrate_memories(
+                'source_user', 'target_user', batch_size=1, scroll_shards=1
+            )
+        scrolls_at_failure = semantic_scrolls
+        await asyncio.sleep(0.01)
+
+        # Assert - the semantic migration made no progress after the failure surfaced
+        assert semantic_scrolls == scrolls_at_failure
+
+    async def test_migrate_memories_stream_close_stops_migration(self):
+        """Test closing the progress stream early cancels the running migration."""
+        # Setup
+        qdrant_mock = AsyncMock()
+        qdrant_mock.collection_exists.side_effect = lambda name: name.startswith('episodic_')
+        qdrant_mock.count.return_value = MagicMock(count=100)
+        scrolls = 0
+
+        async def scroll(offset=None, **kwargs):
+            nonlocal scrolls
+            scrolls += 1
+            return [MagicMock(id=scrolls, vector=[0.1], payload={})], scrolls
+
+        qdrant_mock.scroll.side_effect = scroll
+
+        memory_manager = MemoryManager(
+            qdrant_client=qdrant_mock,
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+
+        # Execute - take one progress update, then stop iterating
+        stream = memory_manager.migrate_memories_stream(
+            'source_user', 'target_user', batch_size=1, scroll_shards=1
+        )
+        await stream.__anext__()
+        await stream.aclose()
+        scrolls_at_close = scrolls
+        await asyncio.sleep(0.01)
+
+        # Assert - the bounded progress queue held the migration back, and it stopped on close
+        assert scrolls_at_close <= 20
+        assert scrolls == scrolls_at_close
+
+    async def test_migration_shard_filters_catch_non_numeric_scores(self):
+        """Test the last migration shard takes every point the score ranges miss."""
+        # Setup
+        memory_manager = MemoryManager(
+            qdrant_client=AsyncMock(),
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+
+        # Execute
+        filters = memory_manager._migration_shard_filters(4)
+
+        # Assert - four score ranges, then a catch-all excluding exactly those ranges
+        range_conditions = [shard.must[0] for shard in filters[:-1]]
+        assert len(range_conditions) == 4
+        assert filters[-1].must is None
+        assert filters[-1].must_not == range_conditions
+
+    async def test_migrate_memories_move_fails_when_points_are_left_behind(self):
+        """Test a move raises if the source still holds points after every shard finished."""
+        # Setup
+        qdrant_mock = AsyncMock()
+        qdrant_mock.collection_exists.side_effect = lambda name: name == 'episodic_source_user'
+        qdrant_mock.count.return_value = MagicMock(count=1)
+        qdrant_mock.scroll.return_value = ([], None)
+
+        memory_manager = MemoryManager(
+            qdrant_client=qdrant_mock,
+            embedding_client=AsyncMock(),
+            importance_scorer=AsyncMock(),
+            mmr_ranker=MagicMock(),
+            db_manager=AsyncMock()
+        )
+
+        # Execute / Assert
+        with pytest.raises(MemoryManagerError):
+            await memory_manager.migrate_memories(
+                'source_user', 'target_user', batch_size=1, scroll_shards=1, delete_source=True
+            )
@@ -4,11 +4,14 @@ Tests PAD state updates, quirk evolution, and need calculations.
 """
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 
 from companion.gateway.models.personality import PADState, BigFiveTraits, Quirk, PsychologicalNeed
+from companion.gateway.database import DatabaseTransaction
 from companion.gateway.services.personality_engine import PersonalityEngine
+from companion.gateway.utils.exceptions import UserNotFoundError
 
 
 @pytest.mark.asyncio
@@ -259,4 +262,95 @@ class TestPersonalityEngine:
             # Verify the method returns a string
             assert isinstance(emotion_label, str)
             # Verify the returned label matches expected octant
-            assert emotion_label == expected_label
\ No newline at end of file
+            assert emotion_label == expected_label
+
+    async def test_personality_snapshot_is_cached_until_write(self):
+        """Test snapshot reads are served from cache and invalidated by writes."""
+        # Setup
+        db_mock = AsyncMock()
+        personality_engine = PersonalityEngine(db_mock)
+        user_id = 'test_user_8'
+        db_mock.execute_user_fetchrow.return_value = {
+            'openness': 0.5, 'conscientiousness': 0.5, 'extraversion': 0.5,
+            'agreeableness': 0.5, 'neuroticism': 0.5,
+            'pleasure': 0.1, 'arousal': 0.2, 'dominance': 0.3, 'emotion_label': 'exuberant',
+            'pad_baseline': '{"pleasure": 0.0, "arousal": 0.0, "dominance": 0.0}',
+            'quirks': None, 'needs': None
+        }
+
+        # Concurrent reads share a single fetch
+        first, second = await asyncio.gather(
+            personality_engine.get_personality_snapshot(user_id),
+            personality_engine.get_personality_snapshot(user_id)
+        )
+        assert first is second
+        assert db_mock.execute_user_fetchrow.await_count == 1
+        # The per-user lock is released with its last caller
+        assert personality_engine._snapshot_locks == {}
+
+        # A write drops the cached snapshot
+        await personality_engine.update_need_level(user_id, 'social', 0.1)
+        await personality_engine.get_personality_snapshot(user_id)
+        assert db_mock.execute_user_query.await_count == 1
+        assert db_mock.execute_user_fetchrow.await_count == 2
+
+    async def test_pad_state_update_retries_after_concurrent_update(self):
+        """Test a PAD update that loses the race for the current row retries instead of failing."""
+        # Setup
+        db_mock = AsyncMock()
+        personality_engine = PersonalityEngine(db_mock)
+        user_id = 'test_user_9'
+        db_mock.execute_user_query.side_effect = [
+            [],
+            [{'pleasure': 0.4, 'arousal': 0.1, 'dominance': 0.2, 'emotion_label': 'exuberant'}]
+        ]
+        db_mock.execute_user_fetchval.return_value = True
+
+        # Execute
+        result = await personality_engine.update_pad_state(
+            user_id, PADState(pleasure=0.3, arousal=0.1, dominance=0.4)
+        )
+
+        # Assert
+        assert result.pleasure == 0.4
+        assert db_mock.execute_user_query.await_count == 2
+
+    async def test_pad_state_update_without_personality_raises_not_found(self):
+        """Test a PAD update for a user with no personality state raises UserNotFoundError."""
+        # Setup
+        db_mock = AsyncMock()
+        personality_engine = PersonalityEngine(db_mock)
+        db_mock.execute_user_query.return_value = []
+        db_mock.execute_user_fetchval.return_value = False
+
+        # Execute / Assert
+        with pytest.raises(UserNotFoundError):
+            await personality_engine.update_pad_state(
+                'test_user_10', PADState(pleasure=0.3, arousal=0.1, dominance=0.4)
+            )
+        assert db_mock.execute_user_query.await_count == 1
+
+    async def test_initialize_personalities_large_cohort(self):
+        """Test a large cohort is inserted with one statement per table rather than COPY."""
+        # Setup
+        connection_mock = AsyncMock()
+        db_mock = MagicMock()
+
+        @asynccontextmanager
+        async def get_transaction():
+            yield DatabaseTransaction(connection_mock)
+
+        db_mock.get_transaction = get_transaction
+        personality_engine = PersonalityEngine(db_mock)
+        user_ids = [f'test_user_{i}' for i in range(150)]
+
+        # Execute
+        created = await personality_engine.initialize_personalities(user_ids)
+
+        # Assert - personality_state, quirks and needs, each in a single statement
+        assert created == 150
+        assert connection_mock.execute.await_count == 3
+        connection_mock.copy_records_to_table.assert_not_called()
+        state_args = connection_mock.execute.await_args_list[0].args
+        assert state_args[1] == user_ids
+        assert state_args[-1] == {"pleasure": 0.0, "arousal": 0.0, "dominance": 0.0}